@@ -337,9 +337,13 @@ def integrate_talking_head_into_video(
     output_video: str,
     start_time: float,
     position: str = "bottom-right",
-    size_px: int = 280
+    size_px: int = 280,
+    video_codec_args: list = None
 ) -> str:
-    """Overlay talking head video onto main video at specified timestamp."""
+    """Overlay talking head video onto main video at specified timestamp.
+    
+    video_codec_args overrides the default libx264 (slow, CRF 17) encoder flags.
+    """
     print(f"🎬 Integrating talking head at {start_time:.1f}s (size: {size_px}px)...")
     
     th_duration = get_video_duration(talking_head_video)
@@ -384,9 +388,7 @@ def integrate_talking_head_into_video(
         "-map", "[outv]",
         "-map", "0:a",
         "-c:a", "aac", "-b:a", "192k",
-        "-c:v", "libx264",
-        "-preset", "slow",
-        "-crf", "17",
+        *(video_codec_args or ["-c:v", "libx264", "-preset", "slow", "-crf", "17"]),
         "-pix_fmt", "yuv420p",
         "-movflags", "+faststart",
         output_video
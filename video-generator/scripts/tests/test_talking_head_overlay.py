@@ -0,0 +1,104 @@
+"""
+Tests for vg talking-head overlay helpers.
+
+Run from video-generator/scripts:
+    python -m unittest discover -s tests
+"""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from vg_common import get_ffmpeg, get_ffprobe
+from vg_commands import talking_head as th
+
+FFMPEG = get_ffmpeg()
+FFPROBE = get_ffprobe()
+
+
+def _encode(args: list, output: Path):
+    subprocess.run([FFMPEG, "-y", "-v", "error", *args, str(output)], check=True)
+
+
+class OverlaySpecTest(unittest.TestCase):
+    """Overlay placements parse their time like float(), splitting at the last colon."""
+
+    def test_float_time_forms(self):
+        for time_part, expected in [("3", 3.0), ("47.6", 47.6), ("1e3", 1000.0), (".5", 0.5),
+                                    ("+2", 2.0), ("-1", -1.0), ("2.", 2.0), ("1_0", 10.0)]:
+            with self.subTest(time_part=time_part):
+                self.assertEqual(th._parse_overlay_spec(f"th.mp4:{time_part}"), (Path("th.mp4"), expected))
+
+    def test_path_with_colons(self):
+        self.assertEqual(th._parse_overlay_spec("C:/clips/th.mp4:1.5"), (Path("C:/clips/th.mp4"), 1.5))
+
+    def test_invalid_specs(self):
+        for spec in ["th.mp4", "th.mp4:", "th.mp4:abc", "th.mp4:inf", "th.mp4:nan"]:
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    th._parse_overlay_spec(spec)
+
+
+@unittest.skipUnless(FFMPEG and FFPROBE, "ffmpeg and ffprobe are required")
+class OverlayWindowedSpliceTest(unittest.TestCase):
+    """The windowed path must only write output that decodes across window boundaries."""
+
+    CODEC = ["-c:v", "libx264", "-preset", "medium", "-crf", "20"]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        # 30s at 25fps with libx264's default GOP (250): keyframes at 0, 10 and 20s
+        self.overlay = self.tmp / "overlay.mp4"
+        _encode(["-f", "lavfi", "-i", "testsrc2=size=80x80:rate=25", "-t", "2", *self.CODEC], self.overlay)
+        self.placement = {"file": str(self.overlay), "start_s": 12.0, "duration_s": 2.0, "end_s": 14.0}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _source(self, codec: list) -> Path:
+        source = self.tmp / "main.mp4"
+        _encode(["-f", "lavfi", "-i", "testsrc=size=320x240:rate=25", "-t", "30",
+                 *codec, "-pix_fmt", "yuv420p"], source)
+        return source
+
+    def _windowed(self, source: Path, output: Path) -> bool:
+        return th._overlay_windowed(
+            FFMPEG, source, [self.placement], output, 30.0,
+            80, "bottom-right", "2", self.CODEC, "+faststart", ""
+        )
+
+    def test_spliced_output_decodes_across_window(self):
+        source = self._source(self.CODEC)
+        output = self.tmp / "out.mp4"
+        self.assertTrue(self._windowed(source, output))
+
+        # -xerror stops at the first decode error, e.g. at the 10s/20s splice points
+        result = subprocess.run(
+            [FFMPEG, "-v", "error", "-xerror", "-i", str(output), "-f", "null", "-"],
+            capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stderr.strip(), "")
+
+        frames = subprocess.run(
+            [FFPROBE, "-v", "error", "-select_streams", "v:0", "-count_frames",
+             "-show_entries", "stream=nb_read_frames", "-of", "csv=p=0", str(output)],
+            capture_output=True, text=True
+        ).stdout.strip()
+        self.assertEqual(frames, "750")
+
+    def test_mismatched_stream_parameters_fall_back(self):
+        # ultrafast disables CABAC, so the source's PPS can't match the window encode
+        source = self._source(["-c:v", "libx264", "-preset", "ultrafast"])
+        output = self.tmp / "out.mp4"
+        self.assertFalse(self._windowed(source, output))
+        self.assertFalse(output.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
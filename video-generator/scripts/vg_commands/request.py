@@ -8,12 +8,41 @@ This module provides CLI commands that use the unified parser.
 """
 
 import argparse
+import functools
+import io
+import os
+import re
 from pathlib import Path
 from typing import Optional
 
 # Import from core utils (path set by vg entry point)
 from vg_core_utils import parse_request_file as parse_request_file_core, markers_to_md_block
 
+# Markers added automatically by the recorder; never required from the AI.
+# t_page_loaded is auto-added by session start.
+_AUTO_MARKERS = frozenset({"t_page_loaded", "t_start_recording", "t_recording_complete"})
+
+# Invariant header of run_report.md
+_RUN_REPORT_HEADER = (
+    "# Run Report: {run_id}\n"
+    "\n"
+    "- Run directory: {run_dir}\n"
+    "- Final video: {final_video}\n"
+    "- Video (converted): {video}\n"
+    "- Timeline source: {timeline_source}\n"
+    "- Request file: {request_file}\n"
+    "\n"
+)
+
+# Tags delimiting the embedded run report in a request file
+_START_TAG = "<!-- RUN_RESULTS_START -->"
+_END_TAG = "<!-- RUN_RESULTS_END -->"
+_START_TAG_B = _START_TAG.encode("ascii")
+_END_TAG_B = _END_TAG.encode("ascii")
+
+# Embedded run report block (matched on raw bytes)
+_RUN_RESULTS_BLOCK_RE = re.compile(re.escape(_START_TAG_B) + rb".*?" + re.escape(_END_TAG_B) + rb"\n?", re.DOTALL)
+
 
 def register(subparsers):
     """Register request commands."""
@@ -43,8 +72,54 @@ def parse_request_file(file_path: str) -> dict:
     
     This wrapper exists for backward compatibility - it returns the unified
     parser result directly. All parsing logic is in vg_core_utils/md_parser.py.
+
+    Results are cached per (resolved path, mtime, size), so re-parsing an
+    unchanged file within one process is free and edits invalidate the cache.
     """
-    return parse_request_file_core(Path(file_path))
+    path = Path(file_path)
+    st = path.stat()
+    return _parse_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def _markers_md_block(markers: dict) -> str:
+    """markers_to_md_block, memoized on the marker contents."""
+    return _markers_md_block_cached(tuple(markers.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _markers_md_block_cached(items: tuple) -> str:
+    return markers_to_md_block(dict(items))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a request file; cache key includes mtime/size for invalidation."""
+    return parse_request_file_core(Path(path_str))
+
+
+def _write_chunks(path: Path, chunks: list) -> None:
+    """Replace a file's contents with byte chunks, without joining them first.
+
+    Uses a single writev() where available (POSIX); elsewhere falls back to
+    write_bytes() on the joined data.
+    """
+    if not hasattr(os, "writev"):
+        path.write_bytes(b"".join(chunks))
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        pending = [memoryview(c) for c in chunks if len(c)]
+        while pending:
+            written = os.writev(fd, pending)
+            # writev may be partial: drop what was written and retry the rest
+            while pending and written >= len(pending[0]):
+                written -= len(pending[0])
+                pending.pop(0)
+            if pending and written:
+                pending[0] = pending[0][written:]
+    finally:
+        os.close(fd)
 
 
 def cmd_parse(args) -> dict:
@@ -80,13 +155,14 @@ def cmd_parse(args) -> dict:
         
         # Extract required markers from voiceover segments
         # These are the markers AI must add during recording for voiceover to sync correctly
+        # (deduplicated in one pass, preserving order)
         required_markers = []
+        seen = set()
         for seg in segments:
             anchor = seg.get("anchor")
-            if anchor and anchor not in ["t_page_loaded", "t_start_recording", "t_recording_complete"]:
-                # t_page_loaded is auto-added by session start
+            if anchor and anchor not in _AUTO_MARKERS and anchor not in seen:
+                seen.add(anchor)
                 required_markers.append(anchor)
-        required_markers = list(dict.fromkeys(required_markers))  # Remove duplicates, preserve order
         
         # Build AI-friendly output
         return success_response(
@@ -460,22 +536,26 @@ def cmd_generate(args) -> dict:
             except Exception:
                 timeline_markers = None
 
+        # Last known contents of the request file (avoids re-reading it for the run report)
+        request_data = None
         if timeline_markers:
             try:
                 request_text = file_path.read_text(encoding="utf-8")
                 start_tag = "<!-- TIMELINE_MARKERS_START -->"
                 end_tag = "<!-- TIMELINE_MARKERS_END -->"
-                marker_block = markers_to_md_block(timeline_markers)
+                marker_block = _markers_md_block(timeline_markers)
                 if start_tag in request_text and end_tag in request_text:
                     before = request_text.split(start_tag)[0]
                     after = request_text.split(end_tag)[1]
-                    file_path.write_text(before + marker_block + after, encoding="utf-8")
+                    request_text = before + marker_block + after
                 else:
-                    file_path.write_text(request_text + "\n\n" + marker_block + "\n", encoding="utf-8")
+                    request_text = request_text + "\n\n" + marker_block + "\n"
+                request_data = request_text.encode("utf-8")
+                file_path.write_bytes(request_data)
                 # Use request file as timeline source from here on
                 timeline_path = str(file_path)
             except Exception:
-                pass
+                request_data = None
         
         # Step 4: Distribute audio segments across video timeline
         # This places each segment at its proper position based on request markers
@@ -647,67 +727,95 @@ def cmd_generate(args) -> dict:
             results["video"] = str(video_path)
 
         # Build run report (Markdown) and update request file
-        def _build_run_report(run_dir: Path, timeline_path_val: Optional[str]) -> str:
-            lines = [
-                f"# Run Report: {run_id}",
-                "",
-                f"- Run directory: {run_dir}",
-                f"- Final video: {results.get('final_video')}",
-                f"- Video (converted): {results.get('video')}",
-                f"- Timeline source: {timeline_path_val or 'n/a'}",
-                f"- Request file: {file_path}",
-                ""
-            ]
-
-            if timeline_markers:
-                lines.append("## Timeline Markers")
-                lines.append("")
-                lines.append(markers_to_md_block(timeline_markers))
-
-            lines.append("## Screenshots")
-            lines.append("")
+        def _emit_run_report(w, run_dir: Path, timeline_path_val: Optional[str]) -> None:
+            final_video = results.get("final_video")
+            missing_markers = dist_result.get("missing_markers") if dist_result else None
+            segments_distributed = dist_result.get("segments_distributed", 0) if dist_result else 0
+            voiceover_count = len(parsed.get("voiceover_segments", ()))
+
+            w(_RUN_REPORT_HEADER.format_map({
+                "run_id": run_id,
+                "run_dir": run_dir,
+                "final_video": final_video,
+                "video": results.get("video"),
+                "timeline_source": timeline_path_val or "n/a",
+                "request_file": file_path,
+            }))
+
+            # Skip the section when every marker is internal ("_"-prefixed, left out of the table)
+            if timeline_markers and any(not name.startswith("_") for name in timeline_markers):
+                w("## Timeline Markers\n")
+                w("\n")
+                w(f"{_markers_md_block(timeline_markers)}\n")
+
+            w("## Screenshots\n")
+            w("\n")
             screenshot_dir = rp.raw_dir / "screenshots"
-            if screenshot_dir.exists():
-                for shot in sorted(screenshot_dir.glob("*.png")):
-                    lines.append(f"- {shot}")
+            try:
+                with os.scandir(screenshot_dir) as it:
+                    shots = [e.name for e in it if e.name.endswith(".png")]
+            except FileNotFoundError:
+                shots = None
+            if shots is not None:
+                shots.sort()
+                shot_dir = os.fspath(screenshot_dir)
+                w("".join(f"- {os.path.join(shot_dir, name)}\n" for name in shots))
             else:
-                lines.append("- None")
+                w("- None\n")
 
-            lines.append("")
-            lines.append("## Issues")
-            lines.append("")
+            w("\n")
+            w("## Issues\n")
+            w("\n")
             issues = []
-            if dist_result and dist_result.get("missing_markers"):
-                issues.append(f"Missing timeline markers: {', '.join(dist_result.get('missing_markers'))}")
-            if dist_result and dist_result.get("segments_distributed", 0) < len(parsed.get("voiceover_segments", [])):
+            if missing_markers:
+                issues.append(f"Missing timeline markers: {', '.join(missing_markers)}")
+            if dist_result and segments_distributed < voiceover_count:
                 issues.append("Not all narration segments were placed.")
-            if results.get("final_video") and th_opts.get("talking_head_enabled") and not any(step.get("step") == "talking_heads" and step.get("success") for step in results.get("steps", [])):
-                issues.append("Talking heads were not composited (missing placements).")
-            if not issues:
-                issues.append("None detected.")
-            lines.extend([f"- {issue}" for issue in issues])
-            lines.append("")
-            return "\n".join(lines)
-
-        report_md = _build_run_report(rp.run_dir, timeline_path)
+            if final_video and th_opts.get("talking_head_enabled"):
+                th_composited = False
+                for step in results.get("steps", ()):
+                    if step.get("step") == "talking_heads" and step.get("success"):
+                        th_composited = True
+                        break
+                if not th_composited:
+                    issues.append("Talking heads were not composited (missing placements).")
+            for issue in issues or ("None detected.",):
+                w(f"- {issue}\n")
+
+        # Stream the report to disk through a large buffer, keeping a copy for the embed
         report_path = rp.run_dir / "run_report.md"
-        report_path.write_text(report_md, encoding="utf-8")
+        report_buf = io.StringIO()
+        with open(report_path, "w", encoding="utf-8", buffering=131072) as report_file:
+            def _tee(text: str) -> None:
+                report_file.write(text)
+                report_buf.write(text)
+            _emit_run_report(_tee, rp.run_dir, timeline_path)
+        report_md = report_buf.getvalue()
         results["run_report"] = str(report_path)
 
-        # Update request file with latest run report
+        # Embed the latest run report into the request file (None = leave file as is)
+        report_block = b"".join((_START_TAG_B, b"\n\n", report_md.encode("utf-8"), b"\n\n", _END_TAG_B, b"\n"))
         try:
-            request_text = file_path.read_text(encoding="utf-8")
-            start_tag = "<!-- RUN_RESULTS_START -->"
-            end_tag = "<!-- RUN_RESULTS_END -->"
-            report_block = f"{start_tag}\n\n{report_md}\n\n{end_tag}\n"
-            if start_tag in request_text and end_tag in request_text:
-                before = request_text.split(start_tag)[0]
-                after = request_text.split(end_tag)[1]
-                file_path.write_text(before + report_block + after, encoding="utf-8")
+            if request_data is None:
+                request_data = file_path.read_bytes()
+        except OSError as e:
+            print(f"⚠️  Could not read request file to embed run report: {e}")
+
+        if request_data is not None:
+            # An identical embedded block means there is nothing to rewrite
+            new_request_chunks = None
+            match = _RUN_RESULTS_BLOCK_RE.search(request_data)
+            if match:
+                if match.group(0) != report_block:
+                    view = memoryview(request_data)
+                    new_request_chunks = [view[:match.start()], report_block, view[match.end():]]
             else:
-                file_path.write_text(request_text + "\n\n" + report_block, encoding="utf-8")
-        except Exception:
-            pass
+                new_request_chunks = [request_data, b"\n\n", report_block]
+            try:
+                if new_request_chunks is not None:
+                    _write_chunks(file_path, new_request_chunks)
+            except OSError as e:
+                print(f"⚠️  Could not embed run report in request file: {e}")
 
         # Automatic evaluation for AI agents (gentic workflow)
         try:
@@ -6,12 +6,51 @@ Evaluate and analyze video generation runs for quality, performance, and insight
 """
 
 import argparse
+import bisect
+import functools
+import heapq
+import html
+import io
 import json
+import mmap
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import time
+from collections import Counter
 from datetime import datetime, timedelta
-import json
+
+from vg_common import get_ffmpeg, get_ffprobe
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        # Serialize to UTF-8 JSON bytes.
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        # Serialize to UTF-8 JSON bytes.
+        return json.dumps(obj, default=str, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
 
 
 def register(subparsers):
@@ -47,17 +86,201 @@ def register(subparsers):
     dashboard_parser.set_defaults(func=cmd_dashboard)
 
 
+def _parse_frame_rate(value: Optional[str]) -> Optional[float]:
+    # Parse an ffprobe rate such as "30000/1001" or "25" into fps.
+    if not value or value == "0/0":
+        return None
+    try:
+        if "/" in value:
+            num, den = value.split("/", 1)
+            return float(num) / float(den) if float(den) else None
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Canonical store of run evaluations (one JSON object per line, append-only)
+EVALUATIONS_JSONL = Path("evaluations.jsonl")
+# Human-readable view rendered from the store
+EVALUATIONS_MD = Path("evaluations.md")
+
+
+def _parse_evaluation_line(line: bytes) -> Optional[Dict[str, Any]]:
+    # Decode one evaluations.jsonl line (None for blank, torn/partial or non-object lines).
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        evaluation = _json_loads(line)
+    except ValueError:
+        return None
+    if not isinstance(evaluation, dict):
+        return None
+    return evaluation if evaluation.get("run_id") else None
+
+
+def iter_evaluations(path: Path = EVALUATIONS_JSONL) -> Iterator[Dict[str, Any]]:
+    # Yield evaluation records from the store in write order.
+    if not path.exists():
+        return
+
+    with open(path, "rb") as f:
+        for line in f:
+            evaluation = _parse_evaluation_line(line)
+            if evaluation:
+                yield evaluation
+
+
+def iter_evaluations_reversed(path: Path = EVALUATIONS_JSONL,
+                              block_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+    # Yield evaluation records newest-write first, reading the file backwards in blocks.
+    if not path.exists():
+        return
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + partial).split(b"\n")
+            partial = lines.pop(0)  # May continue in the previous block
+            for line in reversed(lines):
+                evaluation = _parse_evaluation_line(line)
+                if evaluation:
+                    yield evaluation
+        evaluation = _parse_evaluation_line(partial)
+        if evaluation:
+            yield evaluation
+
+
+def load_evaluations(path: Path = EVALUATIONS_JSONL) -> Dict[str, Dict[str, Any]]:
+    # Stream the evaluations store into a dict keyed by run_id (last write wins).
+    return {evaluation["run_id"]: evaluation for evaluation in iter_evaluations(path)}
+
+
+# ffmpeg -i banner fields (fallback when ffprobe is unavailable)
+_FFMPEG_INFO_RE = re.compile(
+    r"(?P<duration>Duration: (?P<h>\d{2}):(?P<m>\d{2}):(?P<s>\d{2})\.(?P<cs>\d{2}))"
+    r"|(?P<bitrate>bitrate: (?P<br>\d+) kb/s)"
+    r"|(?P<audio>Audio: (?P<codec>\w+), (?P<sr>\d+) Hz, (?P<ch>\w+))"
+)
+
+# Run status -> emoji used in reports
+_STATUS_EMOJI = {'success': '✅', 'partial_success': '⚠️', 'failure': '❌'}
+
+# Files below these sizes are flagged without running ffprobe/ffmpeg
+_MIN_VIDEO_BYTES = 4096
+_MIN_AUDIO_BYTES = 1024
+
+# Composition issues that count as critical
+_CRITICAL_RE = re.compile(r"unusually short|very low|not found|failed", re.IGNORECASE)
+
+# Issue keyword -> recommendation
+_ISSUE_RECOMMENDATIONS = {
+    "unusually small": "Check recording settings - video files are smaller than expected",
+}
+_ISSUE_TRIGGER_RE = re.compile("|".join(map(re.escape, _ISSUE_RECOMMENDATIONS)))
+
+# evaluations.md format strings
+_EVALUATIONS_HEADER = """# Video Generator Evaluations
+
+All video generation runs with their evaluation results.
+
+## Summary
+
+- **Total Runs:** {total_runs}
+- **Success Rate:** {success_rate:.1%}
+- **Average Quality:** {avg_quality:.2f}/1.0
+
+## Evaluations by Run
+
+"""
+_EVAL_RUN_TEMPLATE = """## {run_id} - {emoji} {status}
+
+**Timestamp:** {timestamp}
+**Duration:** {duration}
+
+### Overview
+
+- **Quality Score:** {quality}/1.0
+- **Phases Completed:** {phases}/4
+- **Total Size:** {size} MB
+- **Issues Found:** {issues}
+- **Recommendations:** {recommendations}
+"""
+_EVAL_ABOVE_AVG = "- **Performance:** 🟢 Above average (+{:.2f})\n"
+_EVAL_BELOW_AVG = "- **Performance:** 🔴 Below average ({:.2f})\n"
+_EVAL_AVERAGE = "- **Performance:** 🟡 Average compared to other runs\n"
+_EVAL_TIME = "- **Evaluation Time:** {:.2f}s\n"
+_EVAL_PHASE_HEADER = "#### {} Phase\n- **Status:** {}\n"
+_EVAL_TECHNICAL = "- **Technical:** {}\n"
+_EVAL_PHASE_QUALITY = "- **Quality:** {:.2f}/1.0\n"
+_EVAL_MARKERS = "- **Markers:** {}\n"
+_EVAL_SEGMENTS = "- **Segments:** {}\n"
+_EVAL_OPERATIONS = "- **Operations:** {}\n"
+
+
+# Score tiers: (ascending thresholds, score per tier). A value above k thresholds
+# (or at/above, for inclusive lookups) scores scores[k].
+_VIDEO_SIZE_MB_TIERS = ((5, 20, 50), (0.0, 0.1, 0.2, 0.3))          # acceptable / good / excellent size
+_VIDEO_BITRATE_TIERS = ((500, 2000, 5000), (0.0, 0.1, 0.2, 0.3))    # kbps
+_VIDEO_FPS_TIERS = ((15, 24, 30), (0.0, 0.1, 0.2, 0.3))             # basic / acceptable / smooth
+_MARKER_COUNT_TIERS = ((0, 5, 10), (0.0, 0.1, 0.2, 0.3))            # basic / acceptable / good coverage
+_MARKER_DENSITY_TIERS = ((1, 2), (0.0, 0.1, 0.2))                   # markers per minute
+_FINAL_DURATION_TIERS = ((10, 30), (0.0, 0.1, 0.2))                 # seconds
+_AUDIO_BITRATE_TIERS = ((32, 64, 128), (0.0, 0.1, 0.2, 0.3))        # kbps
+_AUDIO_SAMPLE_RATE_TIERS = ((11025, 22050, 44100), (0.0, 0.1, 0.2, 0.3))  # basic / acceptable / CD
+
+
+def _tier(value: float, tiers: Tuple[Tuple[float, ...], Tuple[float, ...]], inclusive: bool = False) -> float:
+    # Look up the score tier for value by binary search over the thresholds.
+    thresholds, scores = tiers
+    return scores[(bisect.bisect_right if inclusive else bisect.bisect_left)(thresholds, value)]
+
+
+def _score_audio(avg_bitrate: float, avg_sample_rate: float, avg_size_kb: float) -> float:
+    # Audio quality score (0.0 to 1.0) from plain numbers.
+    score = 0.0
+
+    score += _tier(avg_bitrate, _AUDIO_BITRATE_TIERS)
+    score += _tier(avg_sample_rate, _AUDIO_SAMPLE_RATE_TIERS, inclusive=True)
+
+    # File size factor (reasonable size per segment)
+    if 50 <= avg_size_kb <= 500:  # Reasonable size range
+        score += 0.4
+    elif 20 <= avg_size_kb <= 1000:  # Acceptable range
+        score += 0.2
+
+    # Factor weights sum to 1.0 (bitrate 0.3, sample rate 0.3, size 0.4)
+    return min(1.0, score)
+
+
 class RunEvaluator:
     # Evaluates video generation runs for quality and performance.
 
+    # "| marker | 12.34 |" rows of timeline.md
+    _MARKER_RE_BYTES = re.compile(rb"^\s*\|\s*([^|\n]+?)\s*\|\s*(-?[0-9]+(?:\.[0-9]+)?)\s*\|", re.MULTILINE)
+
     def __init__(self, run_id: str):
         self.run_id = run_id
         self.run_path = Path("videos/runs") / run_id
         self.evaluation_path = self.run_path / "evaluation"
+        # Memoized stat()/exists() lookups; run files don't change during one evaluation
+        self._stat = functools.lru_cache(maxsize=None)(os.stat)
+        self._exists = functools.lru_cache(maxsize=None)(os.path.exists)
+        # ffprobe JSON output per media file path, filled by evaluate_run
+        self._probe_cache: Dict[str, Dict[str, Any]] = {}
+        # Persistent ffprobe results keyed by path, validated by (mtime_ns, size)
+        self._probe_cache_file = self.evaluation_path / "_probe_cache.json"
+        self._disk_probe_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._disk_probe_dirty = False
+        self._disk_probe_lock = threading.Lock()
 
     def evaluate_run(self, detailed: bool = False) -> Dict[str, Any]:
         # Main evaluation entry point.
-        if not self.run_path.exists():
+        if not self._exists(self.run_path):
             return {
                 "success": False,
                 "error": f"Run directory not found: {self.run_path}",
@@ -80,11 +303,31 @@ class RunEvaluator:
         }
 
         try:
-            # Evaluate each phase
-            evaluation["phases"]["recording"] = self.evaluate_recording_phase()
-            evaluation["phases"]["editing"] = self.evaluate_editing_phase()
-            evaluation["phases"]["audio"] = self.evaluate_audio_phase()
-            evaluation["phases"]["composition"] = self.evaluate_composition_phase()
+            # Probe all media files up front, in parallel, instead of one spawn at a time per phase
+            # (files below the size floor are reported by their phase without probing)
+            media_files = [
+                p for p in (self.run_path / "raw" / "recording.webm", self.run_path / "final.mp4")
+                if self._exists(p) and self._stat(p).st_size >= _MIN_VIDEO_BYTES
+            ]
+            audio_dir = self.run_path / "audio"
+            if self._exists(audio_dir) and not MUTAGEN_AVAILABLE:  # mutagen reads audio headers in-process
+                media_files.extend(
+                    p for p in self._list_audio_files(audio_dir)
+                    if self._stat(p).st_size >= _MIN_AUDIO_BYTES
+                )
+            self._probe_cache = self._probe_all(media_files)
+
+            # Evaluate each phase concurrently (independent, I/O-bound; probe cache is filled above)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {name: executor.submit(fn) for name, fn in (
+                    ("recording", self.evaluate_recording_phase),
+                    ("editing", self.evaluate_editing_phase),
+                    ("audio", self.evaluate_audio_phase),
+                    ("composition", self.evaluate_composition_phase),
+                )}
+                evaluation["phases"] = {name: future.result() for name, future in futures.items()}
+
+            self._save_probe_cache()
 
             # Calculate overall metrics
             evaluation["metrics"] = self.calculate_overall_metrics(evaluation["phases"])
@@ -116,6 +359,11 @@ class RunEvaluator:
                 "code": "EVALUATION_ERROR"
             }
 
+    def _list_audio_files(self, audio_dir: Path) -> List[Path]:
+        # List *.mp3 segments in one scandir pass (no glob matching or per-entry stat).
+        with os.scandir(audio_dir) as it:
+            return [Path(entry.path) for entry in it if entry.name.endswith(".mp3") and entry.is_file()]
+
     def evaluate_recording_phase(self) -> Dict[str, Any]:
         # Evaluate the recording phase with enhanced metrics.
         phase_eval = {
@@ -129,43 +377,46 @@ class RunEvaluator:
 
         # Check for recording files
         raw_dir = self.run_path / "raw"
-        if not raw_dir.exists():
+        if not self._exists(raw_dir):
             phase_eval["issues"].append("Raw recording directory not found")
             phase_eval["status"] = "missing"
             return phase_eval
 
         # Check recording.webm
         recording_file = raw_dir / "recording.webm"
-        if not recording_file.exists():
+        if not self._exists(recording_file):
             phase_eval["issues"].append("Recording video file not found")
             phase_eval["status"] = "missing"
             return phase_eval
 
         # Enhanced file analysis
-        file_size = recording_file.stat().st_size
+        file_size = self._stat(recording_file).st_size
         phase_eval["file_size_mb"] = round(file_size / (1024 * 1024), 2)
         phase_eval["technical_metrics"]["file_size_mb"] = phase_eval["file_size_mb"]
 
-        # Get video technical details using ffprobe
-        technical_info = self.get_video_technical_info(recording_file)
-        if technical_info:
-            phase_eval["technical_metrics"].update(technical_info)
-
-        # Check timeline.md for markers
+        # Check timeline.md for markers (before the size check, so a stub recording still reports them)
         timeline_file = self.run_path / "timeline.md"
-        if timeline_file.exists():
+        if self._exists(timeline_file):
             try:
-                with open(timeline_file, 'r') as f:
-                    content = f.read()
-                    # Count marker lines (rough estimate)
-                    marker_lines = [line for line in content.split('\n') if '|' in line and len(line.strip()) > 10]
-                    phase_eval["markers_captured"] = len(marker_lines)
-
-                    # Analyze timeline completeness
-                    phase_eval["timeline_completeness"] = self.analyze_timeline_completeness(content)
+                markers = self._read_timeline_markers(timeline_file)
+                phase_eval["markers_captured"] = len(markers)
+
+                # Analyze timeline completeness
+                phase_eval["timeline_completeness"] = self.analyze_timeline_completeness(markers)
             except Exception as e:
                 phase_eval["issues"].append(f"Could not read timeline: {str(e)}")
 
+        # Cheap size check before spawning ffprobe
+        if file_size < _MIN_VIDEO_BYTES:
+            phase_eval["issues"].append(f"Recording file unusually small ({file_size} bytes, not probed)")
+            phase_eval["status"] = "poor_quality"
+            return phase_eval
+
+        # Get video technical details using ffprobe
+        technical_info = self.get_video_technical_info(recording_file)
+        if technical_info:
+            phase_eval["technical_metrics"].update(technical_info)
+
         # Enhanced quality assessment
         quality_score = self.calculate_video_quality_score(phase_eval)
         phase_eval["quality_score"] = quality_score
@@ -198,9 +449,9 @@ class RunEvaluator:
         trimmed_file = self.run_path / "trimmed.mp4"
         fast_file = self.run_path / "fast.mp4"
 
-        if trimmed_file.exists():
+        if self._exists(trimmed_file):
             phase_eval["operations"].append("trim")
-        if fast_file.exists():
+        if self._exists(fast_file):
             phase_eval["operations"].append("speed-gaps")
 
         if not phase_eval["operations"]:
@@ -223,12 +474,12 @@ class RunEvaluator:
         }
 
         audio_dir = self.run_path / "audio"
-        if not audio_dir.exists():
+        if not self._exists(audio_dir):
             phase_eval["status"] = "skipped"
             return phase_eval
 
         # Count audio files
-        audio_files = list(audio_dir.glob("*.mp3"))
+        audio_files = self._list_audio_files(audio_dir)
         phase_eval["segments"] = len(audio_files)
 
         if not audio_files:
@@ -236,27 +487,25 @@ class RunEvaluator:
             phase_eval["status"] = "missing"
             return phase_eval
 
-        # Analyze each audio file
-        audio_analysis = []
-        total_size = 0
-
-        for audio_file in audio_files:
-            analysis = self.analyze_audio_file(audio_file)
-            audio_analysis.append(analysis)
-            total_size += analysis.get("file_size_kb", 0)
+        # Analyze each audio file (concurrently; cache misses block on probe I/O)
+        audio_analysis = self._analyze_audio_files(audio_files)
+        total_size = sum(analysis.get("file_size_kb", 0) for analysis in audio_analysis)
 
         phase_eval["technical_metrics"]["audio_files"] = audio_analysis
         phase_eval["technical_metrics"]["total_size_kb"] = total_size
 
         # Calculate average metrics
         if audio_analysis:
-            avg_bitrate = sum(a.get("bitrate_kbps", 0) for a in audio_analysis) / len(audio_analysis)
-            avg_duration = sum(a.get("duration", 0) for a in audio_analysis) / len(audio_analysis)
-            avg_sample_rate = sum(a.get("sample_rate", 0) for a in audio_analysis) / len(audio_analysis)
+            n = len(audio_analysis)
+            bitrate_sum = duration_sum = sample_rate_sum = 0
+            for a in audio_analysis:
+                bitrate_sum += a.get("bitrate_kbps", 0)
+                duration_sum += a.get("duration", 0)
+                sample_rate_sum += a.get("sample_rate", 0)
 
-            phase_eval["technical_metrics"]["avg_bitrate_kbps"] = round(avg_bitrate, 1)
-            phase_eval["technical_metrics"]["avg_duration_s"] = round(avg_duration, 2)
-            phase_eval["technical_metrics"]["avg_sample_rate"] = int(avg_sample_rate)
+            phase_eval["technical_metrics"]["avg_bitrate_kbps"] = round(bitrate_sum / n, 1)
+            phase_eval["technical_metrics"]["avg_duration_s"] = round(duration_sum / n, 2)
+            phase_eval["technical_metrics"]["avg_sample_rate"] = int(sample_rate_sum / n)
 
         # Enhanced quality assessment
         phase_eval["quality_score"] = self.calculate_audio_quality_score(phase_eval)
@@ -285,15 +534,21 @@ class RunEvaluator:
         }
 
         final_file = self.run_path / "final.mp4"
-        if not final_file.exists():
+        if not self._exists(final_file):
             phase_eval["issues"].append("Final video file not found")
             phase_eval["status"] = "missing"
             return phase_eval
 
         # Get comprehensive file analysis
-        file_size = final_file.stat().st_size
+        file_size = self._stat(final_file).st_size
         phase_eval["final_size_mb"] = round(file_size / (1024 * 1024), 2)
 
+        # Cheap size check before spawning ffprobe
+        if file_size < _MIN_VIDEO_BYTES:
+            phase_eval["issues"].append(f"Final video file unusually small ({file_size} bytes, not probed)")
+            phase_eval["status"] = "poor_quality"
+            return phase_eval
+
         # Get technical info about final video
         technical_info = self.get_video_technical_info(final_file)
         if technical_info:
@@ -317,10 +572,7 @@ class RunEvaluator:
         phase_eval["quality_score"] = quality_score
 
         # Determine status with more nuanced logic
-        critical_issues = 0
-        for issue in phase_eval["issues"]:
-            if any(keyword in issue.lower() for keyword in ["unusually short", "very low", "not found", "failed"]):
-                critical_issues += 1
+        critical_issues = sum(1 for issue in phase_eval["issues"] if _CRITICAL_RE.search(issue))
 
         if critical_issues >= 2:
             phase_eval["status"] = "poor_quality"
@@ -394,9 +646,11 @@ class RunEvaluator:
         # Generate recommendations based on evaluation.
         recommendations = []
 
-        # Check for common issues and provide recommendations
-        if any("unusually small" in issue for issue in issues):
-            recommendations.append("Check recording settings - video files are smaller than expected")
+        # Check for common issues and provide recommendations (one scan over all issues)
+        triggered = set(_ISSUE_TRIGGER_RE.findall("\n".join(issues)))
+        for keyword, recommendation in _ISSUE_RECOMMENDATIONS.items():
+            if keyword in triggered:
+                recommendations.append(recommendation)
 
         if phases.get("recording", {}).get("markers_captured", 0) == 0:
             recommendations.append("Add timeline markers to request file for better audio sync")
@@ -416,34 +670,21 @@ class RunEvaluator:
 
     def save_evaluation(self, evaluation: Dict[str, Any]):
         # Save evaluation to central evaluations file.
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         self.save_to_central_evaluations(evaluation)
 
         # Add performance metric
-        evaluation_time = time.time() - start_time
+        evaluation_time = time.perf_counter() - start_time
         evaluation["performance"] = {
             "evaluation_time_seconds": round(evaluation_time, 2)
         }
 
     def save_to_central_evaluations(self, evaluation: Dict[str, Any]):
-        # Save evaluation to central evaluations.md file.
-        central_file = Path("evaluations.md")
-
-        # Load existing evaluations
-        existing_evals = {}
-        if central_file.exists():
-            try:
-                with open(central_file, 'r') as f:
-                    content = f.read()
-
-                # Parse existing evaluations (simple format)
-                if "## Evaluations by Run" in content:
-                    # Extract existing evaluations
-                    existing_evals = self.parse_central_evaluations(content)
-            except:
-                pass
+        # Append evaluation to the central evaluations.jsonl store.
+        # evaluations.md is rendered from this store by `vg run dashboard`.
+        _migrate_legacy_evaluations()
+        existing_evals = load_evaluations()
 
         # Add/update this evaluation
         existing_evals[evaluation['run_id']] = evaluation
@@ -451,134 +692,92 @@ class RunEvaluator:
         # Add comparative analysis
         evaluation = self.add_comparative_analysis(evaluation, existing_evals)
 
-        # Generate new central file
-        central_content = self.generate_central_evaluations_file(existing_evals)
-        with open(central_file, 'w') as f:
-            f.write(central_content)
-
-    def parse_central_evaluations(self, content: str) -> Dict[str, Dict]:
-        # Parse central evaluations file to extract evaluations.
-        evaluations = {}
-        current_run = None
-        current_eval = {}
-
-        lines = content.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if line.startswith('## '):
-                # Check if this is a run section
-                if ' - ' in line:
-                    run_id = line.split(' - ')[0].replace('## ', '')
-                    current_run = run_id
-                    current_eval = {'run_id': run_id}
-                    evaluations[run_id] = current_eval
-
-                    # Look for status, timestamp, etc.
-                    while i + 1 < len(lines) and not lines[i + 1].strip().startswith('## '):
-                        i += 1
-                        next_line = lines[i].strip()
-                        if next_line.startswith('**Status:**'):
-                            # Parse status
-                            status_text = next_line.replace('**Status:** ', '')
-                            if '✅' in status_text:
-                                current_eval['status'] = 'success'
-                            elif '⚠️' in status_text:
-                                current_eval['status'] = 'partial_success'
-                            elif '❌' in status_text:
-                                current_eval['status'] = 'failure'
-                        elif next_line.startswith('**Timestamp:**'):
-                            current_eval['timestamp'] = next_line.replace('**Timestamp:** ', '')
-                        elif next_line.startswith('- **Quality Score:**'):
-                            score_text = next_line.replace('- **Quality Score:** ', '').replace('/1.0', '')
-                            try:
-                                current_eval['quality_score'] = float(score_text)
-                            except:
-                                current_eval['quality_score'] = 0.0
-            i += 1
-
-        return evaluations
-
-    def generate_central_evaluations_file(self, evaluations: Dict[str, Dict]) -> str:
+        self._write_run_json(evaluation)
+        self._append_jsonl(evaluation)
+
+    def _write_run_json(self, evaluation: Dict[str, Any]):
+        # Full per-run record, read back by `vg run summary --run-id`.
+        (self.evaluation_path / ".run_evaluation.json").write_bytes(_json_dumps(evaluation, indent=True))
+
+    def _append_jsonl(self, evaluation: Dict[str, Any]):
+        # O(1) append of one evaluation record; later lines win for the same run_id.
+        line = _json_dumps(evaluation) + b"\n"
+        with open(EVALUATIONS_JSONL, "ab") as f:
+            f.write(line)
+
+    @staticmethod
+    def generate_central_evaluations_file(evaluations: Dict[str, Dict]) -> str:
         # Generate the central evaluations.md file.
+        # Summary totals in a single pass
+        total_runs = success_count = 0
+        quality_sum = 0.0
+        for e in evaluations.values():
+            total_runs += 1
+            if e.get('status') == 'success':
+                success_count += 1
+            quality_sum += e.get('metrics', {}).get('quality_score', 0)
+        success_rate = success_count / max(total_runs, 1)
+        avg_quality = quality_sum / max(total_runs, 1)
+
         # Sort by timestamp (newest first)
         sorted_runs = sorted(evaluations.items(),
                            key=lambda x: x[1].get('timestamp', ''),
                            reverse=True)
 
-        total_runs = len(evaluations)
-        success_rate = sum(1 for e in evaluations.values() if e.get('status') == 'success') / max(len(evaluations), 1)
-        avg_quality = sum(e.get('metrics', {}).get('quality_score', 0) for e in evaluations.values()) / max(len(evaluations), 1)
-
-        content = """# Video Generator Evaluations
-
-All video generation runs with their evaluation results.
-
-## Summary
-
-- **Total Runs:** """ + str(total_runs) + """
-- **Success Rate:** """ + "{:.1%}".format(success_rate) + """
-- **Average Quality:** """ + "{:.2f}".format(avg_quality) + """/1.0
-
-## Evaluations by Run
-
-"""
-
-
+        parts = [_EVALUATIONS_HEADER.format(
+            total_runs=total_runs, success_rate=success_rate, avg_quality=avg_quality
+        )]
+        append = parts.append
 
         for run_id, evaluation in sorted_runs:
-            status_emoji = {
-                'success': '✅',
-                'partial_success': '⚠️',
-                'failure': '❌'
-            }.get(evaluation.get('status', 'unknown'), '❓')
+            status_emoji = _STATUS_EMOJI.get(evaluation.get('status', 'unknown'), '❓')
 
             metrics = evaluation.get('metrics', {})
             issues = evaluation.get('issues', [])
             recommendations = evaluation.get('recommendations', [])
 
-            content += "## " + run_id + " - " + status_emoji + " " + evaluation.get('status', 'unknown').replace('_', ' ').title() + "\n\n"
-            content += "**Timestamp:** " + evaluation.get('timestamp', 'unknown') + "\n"
-            content += "**Duration:** " + str(evaluation.get('duration_total_s', 'unknown')) + "\n\n"
-            content += "### Overview\n\n"
-            content += "- **Quality Score:** " + str(metrics.get('quality_score', 0))[:4] + "/1.0\n"
-            content += "- **Phases Completed:** " + str(metrics.get('phases_completed', 0)) + "/4\n"
-            content += "- **Total Size:** " + str(metrics.get('total_size_mb', 0))[:4] + " MB\n"
-            content += "- **Issues Found:** " + str(len(issues)) + "\n"
-            content += "- **Recommendations:** " + str(len(recommendations)) + "\n"
+            append(_EVAL_RUN_TEMPLATE.format(
+                run_id=run_id,
+                emoji=status_emoji,
+                status=evaluation.get('status', 'unknown').replace('_', ' ').title(),
+                timestamp=evaluation.get('timestamp', 'unknown'),
+                duration=evaluation.get('duration_total_s', 'unknown'),
+                quality=str(metrics.get('quality_score', 0))[:4],
+                phases=metrics.get('phases_completed', 0),
+                size=str(metrics.get('total_size_mb', 0))[:4],
+                issues=len(issues),
+                recommendations=len(recommendations),
+            ))
 
             # Add comparative analysis if available
             comparison = metrics.get('comparison')
             if comparison:
                 quality_diff = comparison.get('vs_average_quality', 0)
                 if quality_diff > 0.1:
-                    content += "- **Performance:** 🟢 Above average (+{:.2f})\n".format(quality_diff)
+                    append(_EVAL_ABOVE_AVG.format(quality_diff))
                 elif quality_diff < -0.1:
-                    content += "- **Performance:** 🔴 Below average ({:.2f})\n".format(quality_diff)
+                    append(_EVAL_BELOW_AVG.format(quality_diff))
                 else:
-                    content += "- **Performance:** 🟡 Average compared to other runs\n"
+                    append(_EVAL_AVERAGE)
 
             # Add evaluation performance
             perf = evaluation.get('performance', {})
             if perf.get('evaluation_time_seconds'):
-                content += "- **Evaluation Time:** {:.2f}s\n".format(perf['evaluation_time_seconds'])
-
-            content += "\n### Phase Details\n"
-
+                append(_EVAL_TIME.format(perf['evaluation_time_seconds']))
 
+            append("\n### Phase Details\n")
 
             # Add detailed phase information
             phases = evaluation.get('phases', {})
             for phase_name, phase_data in phases.items():
                 if phase_data.get('status') not in ['unknown', 'skipped']:
-                    content += "#### " + phase_name.title() + " Phase\n"
-                    content += "- **Status:** " + phase_data.get('status', 'unknown').replace('_', ' ').title() + "\n"
+                    append(_EVAL_PHASE_HEADER.format(
+                        phase_name.title(), phase_data.get('status', 'unknown').replace('_', ' ').title()
+                    ))
 
                     # Add technical metrics
                     tech_metrics = phase_data.get('technical_metrics', {})
                     if tech_metrics:
-                        content += "- **Technical:** "
                         tech_details = []
 
                         if 'width' in tech_metrics and 'height' in tech_metrics:
@@ -592,80 +791,154 @@ All video generation runs with their evaluation results.
                         if 'avg_sample_rate' in tech_metrics:
                             tech_details.append(str(tech_metrics['avg_sample_rate']) + "Hz")
 
-                        content += ", ".join(tech_details) + "\n"
+                        append(_EVAL_TECHNICAL.format(", ".join(tech_details)))
 
                     # Add quality score if available
                     if 'quality_score' in phase_data:
-                        content += "- **Quality:** {:.2f}/1.0\n".format(phase_data['quality_score'])
+                        append(_EVAL_PHASE_QUALITY.format(phase_data['quality_score']))
 
                     # Add phase-specific metrics
                     if phase_name == 'recording' and 'markers_captured' in phase_data:
-                        content += "- **Markers:** " + str(phase_data['markers_captured']) + "\n"
+                        append(_EVAL_MARKERS.format(phase_data['markers_captured']))
                     elif phase_name == 'audio' and 'segments' in phase_data:
-                        content += "- **Segments:** " + str(phase_data['segments']) + "\n"
+                        append(_EVAL_SEGMENTS.format(phase_data['segments']))
                     elif phase_name == 'editing' and 'operations' in phase_data:
-                        content += "- **Operations:** " + ", ".join(phase_data['operations']) + "\n"
-
-                    content += "\n"
+                        append(_EVAL_OPERATIONS.format(", ".join(phase_data['operations'])))
+
+                    append("\n")
+
+            append("### Issues\n")
+            append("\n".join(["- " + issue for issue in issues]) if issues else "None")
+            append("\n\n### Recommendations\n")
+            append("\n".join(["- " + rec for rec in recommendations]) if recommendations else "None")
+            append("\n\n---\n")
+
+        return "".join(parts)
+
+
+    def _probe(self, media_file: Path) -> Dict[str, Any]:
+        # ffprobe JSON for one file, reused from the on-disk cache while (mtime, size) match.
+        data = self._cached_probe(media_file)
+        if data is not None:
+            return data
+
+        st = self._stat(media_file)
+        data = self._run_ffprobe(media_file)
+        if data.get("format") or data.get("streams"):
+            with self._disk_probe_lock:
+                self._disk_probe_cache[str(media_file)] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+                self._disk_probe_dirty = True
+        return data
+
+    def _cached_probe(self, media_file: Path) -> Optional[Dict[str, Any]]:
+        # On-disk cached ffprobe JSON for a file, or None if missing/stale.
+        st = self._stat(media_file)
+        with self._disk_probe_lock:
+            if self._disk_probe_cache is None:
+                self._disk_probe_cache = self._load_probe_cache()
+            entry = self._disk_probe_cache.get(str(media_file))
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return entry["data"]
+        return None
 
-            content += "### Issues\n"
-            content += chr(10).join("- " + issue for issue in issues) if issues else "None"
-            content += "\n\n### Recommendations\n"
-            content += chr(10).join("- " + rec for rec in recommendations) if recommendations else "None"
-            content += "\n\n---\n"
+    def _load_probe_cache(self) -> Dict[str, Dict[str, Any]]:
+        # Load evaluation/_probe_cache.json (empty if missing or unreadable).
+        try:
+            return _json_loads(self._probe_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_probe_cache(self):
+        # Persist new probe results for the next evaluation of this run.
+        if not self._disk_probe_dirty:
+            return
+        try:
+            self._probe_cache_file.write_bytes(_json_dumps(self._disk_probe_cache))
+            self._disk_probe_dirty = False
+        except OSError:
+            pass  # Cache only; evaluation results are unaffected
+
+    def _run_ffprobe(self, media_file: Path) -> Dict[str, Any]:
+        # Run ffprobe on one file and return its parsed JSON output.
+        cmd = [
+            get_ffprobe() or "ffprobe",
+            "-v", "error",
+            # Container/stream headers are all we need; don't scan into the frames
+            "-probesize", "32k",
+            "-analyzeduration", "0",
+            "-show_entries",
+            "stream=codec_type,codec_name,width,height,avg_frame_rate,r_frame_rate,bit_rate,sample_rate,channels"
+            ":format=duration,bit_rate,size",
+            "-of", "json",
+            str(media_file)
+        ]
+
+        result = subprocess.run(cmd, capture_output=True)
+        return _json_loads(result.stdout)
+
+    def _probe_all(self, paths: List[Path]) -> Dict[str, Dict[str, Any]]:
+        # Probe many files: cache hits are served inline, only misses spawn ffprobe
+        # (one input per process), concurrently across a thread pool.
+        results = {}
+        misses = []
+        for path in paths:
+            data = self._cached_probe(path)
+            if data is not None:
+                results[str(path)] = data
+            else:
+                misses.append(path)
+
+        if not misses:
+            return results
+
+        def probe_one(path: Path):
+            try:
+                return str(path), self._probe(path)
+            except Exception:
+                return str(path), None
 
-        return content
+        if len(misses) == 1:
+            probed = [probe_one(misses[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(misses), os.cpu_count() or 4)) as executor:
+                probed = list(executor.map(probe_one, misses))
 
+        results.update((key, data) for key, data in probed if data is not None)
+        return results
 
     def get_video_technical_info(self, video_file: Path) -> Dict[str, Any]:
-        # Extract technical information from video file using ffmpeg
+        # Extract technical information from video file using ffprobe JSON (cached by evaluate_run)
         try:
-            import subprocess
-            import re
-
-            # Use ffmpeg -i to get stream information
-            cmd = [
-                "./node_modules/ffmpeg-static/ffmpeg",
-                "-i", str(video_file)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.run_path.parent.parent)
-
-            # Parse ffmpeg output for technical info
-            output = result.stderr  # ffmpeg info goes to stderr
+            data = self._probe_cache.get(str(video_file))
+            if data is None:
+                data = self._probe(video_file)
 
             info = {}
 
-            # Extract duration (format: Duration: 00:00:10.50)
-            duration_match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})', output)
-            if duration_match:
-                hours, minutes, seconds, centiseconds = map(int, duration_match.groups())
-                info['duration'] = hours * 3600 + minutes * 60 + seconds + centiseconds / 100
-
-            # Extract bitrate (format: bitrate: 128 kb/s)
-            bitrate_match = re.search(r'bitrate: (\d+) kb/s', output)
-            if bitrate_match:
-                info['bitrate'] = int(bitrate_match.group(1))
-
-            # Extract video info (format: Video: h264 (Main) (avc1 / 0x31637661), yuv420p, 1920x1080)
-            video_match = re.search(r'Video: (\w+).*?, .*?, (\d{3,4}x\d{3,4})', output)
-            if video_match:
-                info['codec'] = video_match.group(1)
-                width_height = video_match.group(2).split('x')
-                info['width'] = int(width_height[0])
-                info['height'] = int(width_height[1])
-
-            # Extract FPS (format: 30 fps)
-            fps_match = re.search(r'(\d+(?:\.\d+)?) fps', output)
-            if fps_match:
-                info['fps'] = float(fps_match.group(1))
+            fmt = data.get("format", {})
+            if fmt.get("duration"):
+                info['duration'] = float(fmt["duration"])
+            if fmt.get("bit_rate"):
+                info['bitrate'] = int(fmt["bit_rate"]) // 1000  # kb/s
+
+            streams = [st for st in data.get("streams") or [] if st.get("codec_type") == "video"]
+            if streams:
+                stream = streams[0]
+                if stream.get("codec_name"):
+                    info['codec'] = stream["codec_name"]
+                if stream.get("width") and stream.get("height"):
+                    info['width'] = int(stream["width"])
+                    info['height'] = int(stream["height"])
+                fps = _parse_frame_rate(stream.get("avg_frame_rate")) or _parse_frame_rate(stream.get("r_frame_rate"))
+                if fps:
+                    info['fps'] = fps
 
             return info
 
         except Exception as e:
             # If ffmpeg analysis fails, return basic file info
             try:
-                file_size = video_file.stat().st_size
+                file_size = self._stat(video_file).st_size
                 return {
                     'file_size_mb': round(file_size / (1024 * 1024), 2),
                     'analysis_failed': True,
@@ -674,42 +947,28 @@ All video generation runs with their evaluation results.
             except:
                 return {}
 
-    def analyze_timeline_completeness(self, timeline_content: str) -> Dict[str, Any]:
+    def _read_timeline_markers(self, timeline_file: Path) -> List[Tuple[str, float]]:
+        # (marker, time) rows of timeline.md in one regex scan, straight off the mapped file.
+        if not self._stat(timeline_file).st_size:
+            return []  # Empty files can't be mapped
+
+        with open(timeline_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [(name.decode('utf-8', 'replace'), float(time_s))
+                    for name, time_s in self._MARKER_RE_BYTES.findall(mm)]
+
+    def analyze_timeline_completeness(self, markers: List[Tuple[str, float]]) -> Dict[str, Any]:
         # Analyze timeline marker completeness and quality
         analysis = {
-            "total_markers": 0,
-            "unique_markers": 0,
+            "total_markers": len(markers),
+            "unique_markers": len({name for name, _ in markers}),
             "time_span_s": 0,
             "marker_density": 0  # markers per minute
         }
 
-        try:
-            lines = timeline_content.split('\n')
-            markers = []
-            seen_markers = set()
-
-            for line in lines:
-                if '|' in line and len(line.strip()) > 10:
-                    parts = [p.strip() for p in line.split('|') if p.strip()]
-                    if len(parts) >= 3:
-                        marker_name = parts[1]
-                        try:
-                            time_s = float(parts[2])
-                            markers.append((marker_name, time_s))
-                            seen_markers.add(marker_name)
-                        except ValueError:
-                            continue
-
-            analysis["total_markers"] = len(markers)
-            analysis["unique_markers"] = len(seen_markers)
-
-            if markers:
-                times = [m[1] for m in markers]
-                analysis["time_span_s"] = max(times) - min(times)
-                analysis["marker_density"] = (len(markers) / max(analysis["time_span_s"], 60)) * 60  # per minute
-
-        except Exception:
-            pass
+        if markers:
+            times = [time_s for _, time_s in markers]
+            analysis["time_span_s"] = max(times) - min(times)
+            analysis["marker_density"] = (len(markers) / max(analysis["time_span_s"], 60)) * 60  # per minute
 
         return analysis
 
@@ -719,13 +978,7 @@ All video generation runs with their evaluation results.
         factors = 0
 
         # File size factor (larger = potentially better quality)
-        file_size_mb = phase_eval.get("file_size_mb", 0)
-        if file_size_mb > 50:
-            score += 0.3  # Excellent size
-        elif file_size_mb > 20:
-            score += 0.2  # Good size
-        elif file_size_mb > 5:
-            score += 0.1  # Acceptable size
+        score += _tier(phase_eval.get("file_size_mb", 0), _VIDEO_SIZE_MB_TIERS)
         factors += 0.3
 
         # Technical metrics factor
@@ -748,22 +1001,10 @@ All video generation runs with their evaluation results.
                 tech_score += 0.2  # 480p
 
             # Bitrate score (kbps)
-            bitrate = tech.get("bitrate", 0)
-            if bitrate > 5000:
-                tech_score += 0.3  # High bitrate
-            elif bitrate > 2000:
-                tech_score += 0.2  # Good bitrate
-            elif bitrate > 500:
-                tech_score += 0.1  # Acceptable bitrate
+            tech_score += _tier(tech.get("bitrate", 0), _VIDEO_BITRATE_TIERS)
 
             # FPS score
-            fps = tech.get("fps", 0)
-            if fps >= 30:
-                tech_score += 0.3  # Smooth playback
-            elif fps >= 24:
-                tech_score += 0.2  # Acceptable
-            elif fps >= 15:
-                tech_score += 0.1  # Basic
+            tech_score += _tier(tech.get("fps", 0), _VIDEO_FPS_TIERS, inclusive=True)
 
         score += tech_score * 0.4
         factors += 0.4
@@ -772,19 +1013,8 @@ All video generation runs with their evaluation results.
         timeline = phase_eval.get("timeline_completeness", {})
         timeline_score = 0
 
-        marker_count = timeline.get("total_markers", 0)
-        if marker_count > 10:
-            timeline_score += 0.3  # Good marker coverage
-        elif marker_count > 5:
-            timeline_score += 0.2  # Acceptable coverage
-        elif marker_count > 0:
-            timeline_score += 0.1  # Basic coverage
-
-        density = timeline.get("marker_density", 0)
-        if density > 2:  # More than 2 markers per minute
-            timeline_score += 0.2  # Good density
-        elif density > 1:
-            timeline_score += 0.1  # Acceptable density
+        timeline_score += _tier(timeline.get("total_markers", 0), _MARKER_COUNT_TIERS)
+        timeline_score += _tier(timeline.get("marker_density", 0), _MARKER_DENSITY_TIERS)
 
         score += timeline_score * 0.3
         factors += 0.3
@@ -818,48 +1048,65 @@ All video generation runs with their evaluation results.
         evaluation.setdefault('metrics', {})['comparison'] = comparison
         return evaluation
 
+    def _analyze_audio_files(self, audio_files: List[Path]) -> List[Dict[str, Any]]:
+        # Run analyze_audio_file over all segments on a small thread pool, preserving order.
+        if len(audio_files) <= 1:
+            return [self.analyze_audio_file(audio_file) for audio_file in audio_files]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(audio_files))) as executor:
+            return list(executor.map(self.analyze_audio_file, audio_files))
+
     def analyze_audio_file(self, audio_file: Path) -> Dict[str, Any]:
         # Analyze individual audio file for technical metrics.
+        data = self._probe_cache.get(str(audio_file))
+        if data is not None:
+            return self._audio_info_from_probe(audio_file, data)
+
+        file_size = self._stat(audio_file).st_size
+        if file_size < _MIN_AUDIO_BYTES:
+            # Too small to hold real audio; not worth an ffmpeg spawn
+            return {"filename": audio_file.name, "file_size_kb": round(file_size / 1024, 1)}
+
+        # Read the container header in-process when mutagen is installed
+        if MUTAGEN_AVAILABLE:
+            info = self._audio_info_from_mutagen(audio_file)
+            if info:
+                return info
+
+        # Single ffprobe JSON parse
         try:
-            import subprocess
-            import re
+            data = self._probe(audio_file)
+            if data.get("format") or data.get("streams"):
+                return self._audio_info_from_probe(audio_file, data)
+        except Exception:
+            pass  # No usable ffprobe; fall back to parsing ffmpeg's banner
 
+        try:
             cmd = [
-                "./node_modules/ffmpeg-static/ffmpeg",
+                get_ffmpeg() or "ffmpeg",
                 "-i", str(audio_file)
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.run_path.parent.parent)
+            result = subprocess.run(cmd, capture_output=True, text=True)
             output = result.stderr
 
             info = {
                 "filename": audio_file.name,
-                "file_size_kb": round(audio_file.stat().st_size / 1024, 1)
+                "file_size_kb": round(self._stat(audio_file).st_size / 1024, 1)
             }
 
-            # Extract duration (format: Duration: 00:00:10.50)
-            duration_match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})', output)
-            if duration_match:
-                hours, minutes, seconds, centiseconds = map(int, duration_match.groups())
-                info['duration'] = hours * 3600 + minutes * 60 + seconds + centiseconds / 100
-
-            # Extract bitrate (format: bitrate: 128 kb/s)
-            bitrate_match = re.search(r'bitrate: (\d+) kb/s', output)
-            if bitrate_match:
-                info['bitrate_kbps'] = int(bitrate_match.group(1))
-
-            # Extract audio info (format: Audio: mp3, 44100 Hz, stereo)
-            audio_match = re.search(r'Audio: (\w+), (\d+) Hz, (\w+)', output)
-            if audio_match:
-                info['codec'] = audio_match.group(1)
-                info['sample_rate'] = int(audio_match.group(2))
-                channels_text = audio_match.group(3)
-                if channels_text == 'stereo':
-                    info['channels'] = 2
-                elif channels_text == 'mono':
-                    info['channels'] = 1
-                else:
-                    info['channels'] = 1
+            # Duration / bitrate / audio stream fields in one scan (first occurrence of each wins), e.g.
+            # "Duration: 00:00:10.50, start: 0.0, bitrate: 128 kb/s" and "Audio: mp3, 44100 Hz, stereo"
+            for match in _FFMPEG_INFO_RE.finditer(output):
+                if match.lastgroup == 'duration' and 'duration' not in info:
+                    hours, minutes, seconds, centiseconds = map(int, match.group('h', 'm', 's', 'cs'))
+                    info['duration'] = hours * 3600 + minutes * 60 + seconds + centiseconds / 100
+                elif match.lastgroup == 'bitrate' and 'bitrate_kbps' not in info:
+                    info['bitrate_kbps'] = int(match.group('br'))
+                elif match.lastgroup == 'audio' and 'codec' not in info:
+                    info['codec'] = match.group('codec')
+                    info['sample_rate'] = int(match.group('sr'))
+                    info['channels'] = 2 if match.group('ch') == 'stereo' else 1
 
             return info
 
@@ -867,7 +1114,7 @@ All video generation runs with their evaluation results.
             # Fallback basic info
             return {
                 "filename": audio_file.name,
-                "file_size_kb": round(audio_file.stat().st_size / 1024, 1),
+                "file_size_kb": round(self._stat(audio_file).st_size / 1024, 1),
                 "duration": 0,
                 "bitrate_kbps": 0,
                 "sample_rate": 0,
@@ -877,44 +1124,59 @@ All video generation runs with their evaluation results.
                 "error": str(e)
             }
 
-    def calculate_audio_quality_score(self, phase_eval: Dict[str, Any]) -> float:
-        # Calculate audio quality score (0.0 to 1.0).
-        score = 0.0
-        factors = 0
+    def _audio_info_from_mutagen(self, audio_file: Path) -> Optional[Dict[str, Any]]:
+        # Build audio metrics from the file header via mutagen (None if unrecognised).
+        try:
+            audio = mutagen.File(str(audio_file))
+        except Exception:
+            return None
+        if audio is None or audio.info is None:
+            return None
 
-        tech = phase_eval.get("technical_metrics", {})
+        stream = audio.info
+        return {
+            "filename": audio_file.name,
+            "file_size_kb": round(self._stat(audio_file).st_size / 1024, 1),
+            "duration": float(getattr(stream, "length", 0) or 0),
+            "bitrate_kbps": int(getattr(stream, "bitrate", 0) or 0) // 1000,
+            "codec": type(audio).__name__.lower(),
+            "sample_rate": int(getattr(stream, "sample_rate", 0) or 0),
+            "channels": int(getattr(stream, "channels", 1) or 1),
+        }
 
-        # Bitrate factor
-        avg_bitrate = tech.get("avg_bitrate_kbps", 0)
-        if avg_bitrate > 128:  # High quality
-            score += 0.3
-        elif avg_bitrate > 64:  # Good quality
-            score += 0.2
-        elif avg_bitrate > 32:  # Acceptable
-            score += 0.1
-        factors += 0.3
+    def _audio_info_from_probe(self, audio_file: Path, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Build audio metrics from cached ffprobe JSON output.
+        info = {
+            "filename": audio_file.name,
+            "file_size_kb": round(self._stat(audio_file).st_size / 1024, 1)
+        }
 
-        # Sample rate factor
-        avg_sample_rate = tech.get("avg_sample_rate", 0)
-        if avg_sample_rate >= 44100:  # CD quality
-            score += 0.3
-        elif avg_sample_rate >= 22050:  # Acceptable
-            score += 0.2
-        elif avg_sample_rate >= 11025:  # Basic
-            score += 0.1
-        factors += 0.3
+        fmt = data.get("format", {})
+        if fmt.get("duration"):
+            info['duration'] = float(fmt["duration"])
+        if fmt.get("bit_rate"):
+            info['bitrate_kbps'] = int(fmt["bit_rate"]) // 1000
+
+        streams = [st for st in data.get("streams") or [] if st.get("codec_type") == "audio"]
+        if streams:
+            stream = streams[0]
+            info['codec'] = stream.get("codec_name", "unknown")
+            info['sample_rate'] = int(stream.get("sample_rate") or 0)
+            info['channels'] = int(stream.get("channels") or 1)
+
+        return info
+
+    def calculate_audio_quality_score(self, phase_eval: Dict[str, Any]) -> float:
+        # Calculate audio quality score (0.0 to 1.0).
+        tech = phase_eval.get("technical_metrics", {})
 
-        # File size factor (reasonable size per segment)
         audio_files = tech.get("audio_files", [])
         if audio_files:
-            avg_size_kb = sum(f.get("file_size_kb", 0) for f in audio_files) / len(audio_files)
-            if 50 <= avg_size_kb <= 500:  # Reasonable size range
-                score += 0.4
-            elif 20 <= avg_size_kb <= 1000:  # Acceptable range
-                score += 0.2
-        factors += 0.4
+            avg_size_kb = tech.get("total_size_kb", 0) / len(audio_files)
+        else:
+            avg_size_kb = -1.0  # No segments: no size points
 
-        return min(1.0, score / max(factors, 0.1))
+        return _score_audio(tech.get("avg_bitrate_kbps", 0), tech.get("avg_sample_rate", 0), avg_size_kb)
 
     def analyze_audio_video_sync(self) -> Dict[str, Any]:
         # Analyze synchronization between audio and video timeline.
@@ -927,32 +1189,19 @@ All video generation runs with their evaluation results.
         try:
             # Read timeline and check audio placements
             timeline_file = self.run_path / "timeline.md"
-            if not timeline_file.exists():
+            if not self._exists(timeline_file):
                 return analysis
 
-            with open(timeline_file, 'r') as f:
-                timeline_content = f.read()
-
             # Parse timeline markers
-            markers = {}
-            for line in timeline_content.split('\n'):
-                if '|' in line and len(line.strip()) > 10:
-                    parts = [p.strip() for p in line.split('|') if p.strip()]
-                    if len(parts) >= 3:
-                        try:
-                            marker_name = parts[1]
-                            time_s = float(parts[2])
-                            markers[marker_name] = time_s
-                        except ValueError:
-                            continue
+            markers = dict(self._read_timeline_markers(timeline_file))
 
             if not markers:
                 return analysis
 
             # Check audio directory for sync information
             audio_dir = self.run_path / "audio"
-            if audio_dir.exists():
-                audio_files = list(audio_dir.glob("*.mp3"))
+            if self._exists(audio_dir):
+                audio_files = self._list_audio_files(audio_dir)
                 analysis["timeline_coverage"] = len(audio_files) / max(len(markers), 1)
 
             # Estimate sync accuracy (simplified - in practice would need more complex analysis)
@@ -977,9 +1226,17 @@ All video generation runs with their evaluation results.
                     phase_eval["issues"].append(f"Audio bitrate varies significantly ({bitrate_range}kbps range)")
 
         # Check sample rate consistency
-        sample_rates = [f.get("sample_rate", 0) for f in audio_files if f.get("sample_rate", 0) > 0]
-        if len(set(sample_rates)) > 1:
-            phase_eval["issues"].append("Inconsistent audio sample rates across segments")
+        # Single pass; stop at the first rate that differs from the first one seen
+        seen_rate = None
+        for audio_file in audio_files:
+            rate = audio_file.get("sample_rate", 0)
+            if rate <= 0:
+                continue
+            if seen_rate is None:
+                seen_rate = rate
+            elif rate != seen_rate:
+                phase_eval["issues"].append("Inconsistent audio sample rates across segments")
+                break
 
         # Check for very short audio segments
         for audio_file in audio_files:
@@ -1000,9 +1257,9 @@ All video generation runs with their evaluation results.
             # Compare final file size to raw recording size
             raw_dir = self.run_path / "raw"
             raw_recording = raw_dir / "recording.webm"
-            if raw_recording.exists():
-                raw_size = raw_recording.stat().st_size
-                final_size = final_file.stat().st_size
+            if self._exists(raw_recording):
+                raw_size = self._stat(raw_recording).st_size
+                final_size = self._stat(final_file).st_size
 
                 if raw_size > 0:
                     compression_ratio = final_size / raw_size
@@ -1036,18 +1293,22 @@ All video generation runs with their evaluation results.
             raw_dir = self.run_path / "raw"
             final_file = self.run_path / "final.mp4"
 
-            if raw_dir.exists() and final_file.exists():
-                # Count processing steps by intermediate files
-                intermediate_files = []
-                for pattern in ["*.mp4", "*.webm"]:
-                    intermediate_files.extend(list(self.run_path.glob(f"**/{pattern}")))
-
-                # Remove raw and final files from count
-                raw_files = list(raw_dir.glob("*"))
-                intermediate_files = [f for f in intermediate_files if f not in raw_files and f != final_file]
-
-                analysis["processing_steps"] = len(intermediate_files)
-                analysis["processing_efficiency"] = min(1.0, 1.0 / max(len(intermediate_files), 1))
+            if self._exists(raw_dir) and self._exists(final_file):
+                # Count processing steps by intermediate video files, in a single tree walk
+                # (raw recordings and the final output don't count)
+                raw_path = str(raw_dir)
+                final_name = final_file.name
+                run_path = str(self.run_path)
+                intermediate_count = 0
+                for dirpath, _dirnames, filenames in os.walk(run_path):
+                    if dirpath == raw_path:
+                        continue
+                    for filename in filenames:
+                        if filename.endswith((".mp4", ".webm")) and not (dirpath == run_path and filename == final_name):
+                            intermediate_count += 1
+
+                analysis["processing_steps"] = intermediate_count
+                analysis["processing_efficiency"] = min(1.0, 1.0 / max(intermediate_count, 1))
 
         except Exception:
             pass
@@ -1110,11 +1371,7 @@ All video generation runs with their evaluation results.
         tech_score = 0
 
         # Duration check
-        duration = tech.get("duration", 0)
-        if duration > 30:  # Reasonable length
-            tech_score += 0.2
-        elif duration > 10:
-            tech_score += 0.1
+        tech_score += _tier(tech.get("duration", 0), _FINAL_DURATION_TIERS)
 
         # Bitrate check
         bitrate = tech.get("bitrate", 0)
@@ -1131,92 +1388,134 @@ All video generation runs with their evaluation results.
 
 
 
+# Legacy evaluations.md sections: "## <run_id> - <emoji> <Status>"
+_LEGACY_RUN_HEADER_RE = re.compile(r"^## (.*?) - (.*)$", re.MULTILINE)
+_LEGACY_TIMESTAMP_RE = re.compile(r"^[ \t]*\*\*Timestamp:\*\* (.*)$", re.MULTILINE)
+_LEGACY_QUALITY_RE = re.compile(r"^[ \t]*- \*\*Quality Score:\*\* (.*?)[ \t]*$", re.MULTILINE)
+
+
+def _parse_legacy_evaluations_md(central_file: Path) -> Dict[str, Dict[str, Any]]:
+    # Parse evaluations.md written before evaluations.jsonl existed.
+    with open(central_file, 'r') as f:
+        content = f.read()
+
+    all_evaluations = {}
+    headers = list(_LEGACY_RUN_HEADER_RE.finditer(content))
+
+    for index, header in enumerate(headers):
+        # Each run section runs until the next "## <run_id> - " header
+        start = header.end()
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(content)
+
+        current_eval = {'run_id': header.group(1)}
+
+        status_text = header.group(2)
+        if '✅' in status_text:
+            current_eval['status'] = 'success'
+        elif '⚠️' in status_text:
+            current_eval['status'] = 'partial_success'
+        elif '❌' in status_text:
+            current_eval['status'] = 'failure'
+
+        timestamp = _LEGACY_TIMESTAMP_RE.search(content, start, end)
+        if timestamp:
+            current_eval['timestamp'] = timestamp.group(1).strip()
+
+        quality = _LEGACY_QUALITY_RE.search(content, start, end)
+        if quality:
+            try:
+                current_eval['metrics'] = {'quality_score': float(quality.group(1).replace('/1.0', ''))}
+            except ValueError:
+                current_eval['metrics'] = {'quality_score': 0.0}
+
+        all_evaluations[current_eval['run_id']] = current_eval
+
+    return all_evaluations
+
+
+def _migrate_legacy_evaluations():
+    # Seed evaluations.jsonl from an evaluations.md that predates it, so older runs stay listed.
+    if EVALUATIONS_JSONL.exists() or not EVALUATIONS_MD.exists():
+        return
+    try:
+        legacy = _parse_legacy_evaluations_md(EVALUATIONS_MD)
+    except OSError:
+        return
+    legacy_runs = sorted(legacy.values(), key=lambda x: x.get('timestamp', ''))
+    with open(EVALUATIONS_JSONL, "ab") as f:
+        f.write(b"".join(_json_dumps(evaluation) + b"\n" for evaluation in legacy_runs))
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    # Parse an ISO date/datetime (naive, for comparison with stored timestamps).
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
 def find_runs(status_filter: Optional[str] = None,
               since: Optional[str] = None,
               until: Optional[str] = None,
               limit: int = 10) -> List[Dict[str, Any]]:
-    # Find runs based on filters from central evaluations file.
-    central_file = Path("evaluations.md")
-    if not central_file.exists():
-        return []
+    # Find runs based on filters from the central evaluations store.
+    # Results are memoized per store state (path, mtime_ns, size), so repeat calls cost one stat.
+    for source in (EVALUATIONS_JSONL, EVALUATIONS_MD):
+        try:
+            st = os.stat(source)
+        except OSError:
+            continue
+        return list(_find_runs_cached(os.path.abspath(source), st.st_mtime_ns, st.st_size,
+                                      status_filter, since, until, limit))
+    return []
+
+
+@functools.lru_cache(maxsize=8)
+def _find_runs_cached(source: str, mtime_ns: int, size: int,
+                      status_filter: Optional[str], since: Optional[str], until: Optional[str],
+                      limit: int) -> Tuple[Dict[str, Any], ...]:
+    # Filters are applied while streaming; only the newest `limit` matches are kept.
+    since_dt = _parse_timestamp(since) if since else None
+    until_dt = _parse_timestamp(until) if until else None
+
+    def matches(run: Dict[str, Any]) -> bool:
+        if status_filter and run.get("status") != status_filter:
+            return False
+        if since_dt or until_dt:
+            ts = _parse_timestamp(run.get('timestamp') or '')
+            if ts:
+                if since_dt and ts < since_dt:
+                    return False
+                if until_dt and ts > until_dt:
+                    return False
+        return True
 
     try:
-        with open(central_file, 'r') as f:
-            content = f.read()
-
-        # Parse all evaluations from central file
-        all_evaluations = {}
-        current_eval = {}
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines):
-            if line.startswith('## ') and ' - ' in line:
-                # Save previous evaluation if exists
-                if current_eval and 'run_id' in current_eval:
-                    all_evaluations[current_eval['run_id']] = current_eval
-
-                # Start new evaluation
-                run_id = line.split(' - ')[0].replace('## ', '')
-                current_eval = {'run_id': run_id}
-
-                # Extract status from the line
-                if '✅' in line:
-                    current_eval['status'] = 'success'
-                elif '⚠️' in line:
-                    current_eval['status'] = 'partial_success'
-                elif '❌' in line:
-                    current_eval['status'] = 'failure'
-
-                # Look for timestamp in next few lines
-                for j in range(i+1, min(i+10, len(lines))):
-                    if lines[j].strip().startswith('**Timestamp:**'):
-                        current_eval['timestamp'] = lines[j].strip().replace('**Timestamp:** ', '')
-                        break
-
-                # Look for quality score
-                for j in range(i+1, min(i+20, len(lines))):
-                    if lines[j].strip().startswith('- **Quality Score:**'):
-                        score_text = lines[j].strip().replace('- **Quality Score:** ', '').replace('/1.0', '')
-                        try:
-                            current_eval['metrics'] = {'quality_score': float(score_text)}
-                        except:
-                            current_eval['metrics'] = {'quality_score': 0.0}
+        if source.endswith(".jsonl"):
+            # Read from the end: the first record seen per run is its latest, and
+            # reading stops as soon as `limit` matching runs are found.
+            runs = {}
+            seen = set()
+            for evaluation in iter_evaluations_reversed(Path(source)):
+                run_id = evaluation["run_id"]
+                if run_id in seen:
+                    continue
+                seen.add(run_id)
+                if matches(evaluation):
+                    runs[run_id] = evaluation
+                    if len(runs) >= limit:
                         break
+        else:
+            runs = {
+                run_id: run for run_id, run in _parse_legacy_evaluations_md(Path(source)).items()
+                if matches(run)
+            }
 
-        # Add the last evaluation
-        if current_eval and 'run_id' in current_eval:
-            all_evaluations[current_eval['run_id']] = current_eval
-
-        # Convert to list and apply filters
-        runs = list(all_evaluations.values())
-
-        # Apply status filter
-        if status_filter:
-            runs = [r for r in runs if r.get("status") == status_filter]
-
-        # Apply date filters (simplified - would need better parsing)
-        if since or until:
-            filtered_runs = []
-            for run in runs:
-                try:
-                    timestamp = run.get('timestamp', '')
-                    if timestamp:
-                        # Simple date check - could be improved
-                        if since and timestamp < since:
-                            continue
-                        if until and timestamp > until:
-                            continue
-                    filtered_runs.append(run)
-                except:
-                    filtered_runs.append(run)
-            runs = filtered_runs
-
-        # Sort by timestamp (newest first) and limit
-        runs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return runs[:limit]
+        # Newest first, limited
+        return tuple(heapq.nlargest(limit, runs.values(), key=lambda x: x.get('timestamp', '')))
 
     except Exception:
-        return []
+        return ()
 
 
 def find_last_run() -> Optional[str]:
@@ -1225,23 +1524,26 @@ def find_last_run() -> Optional[str]:
     if not runs_dir.exists():
         return None
 
-    # Look for the most recent directory
-    run_dirs = sorted(runs_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True)
-    for run_dir in run_dirs:
-        if run_dir.is_dir():
-            # Check if it has a final.mp4 (indicating a completed run)
-            if (run_dir / "final.mp4").exists():
-                return run_dir.name
+    # Newest directory with a final.mp4 (indicating a completed run), in one scandir pass
+    best_name = None
+    best_mtime = -1.0
+    with os.scandir(runs_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            mtime = entry.stat().st_mtime
+            # Only newer candidates need the final.mp4 check
+            if mtime > best_mtime and os.path.exists(os.path.join(entry.path, "final.mp4")):
+                best_name, best_mtime = entry.name, mtime
 
-    return None
+    return best_name
 
 
 
 
 def cmd_evaluate(args) -> Dict[str, Any]:
     # Evaluate a run.
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     run_id = args.run_id
 
@@ -1265,7 +1567,7 @@ def cmd_evaluate(args) -> Dict[str, Any]:
     result = evaluator.evaluate_run(detailed=args.detailed)
 
     # Add evaluation performance
-    evaluation_time = time.time() - start_time
+    evaluation_time = time.perf_counter() - start_time
     if result.get("success") and result.get("evaluation"):
         result["evaluation"]["performance"] = {
             "evaluation_time_seconds": round(evaluation_time, 2)
@@ -1277,14 +1579,8 @@ def cmd_evaluate(args) -> Dict[str, Any]:
     # Create human-readable output
     evaluation = result["evaluation"]
 
-    status_emoji = {
-        "success": "✅",
-        "partial_success": "⚠️",
-        "failure": "❌"
-    }
-
     status = evaluation['status']
-    emoji = status_emoji.get(status, "❓")
+    emoji = _STATUS_EMOJI.get(status, "❓")
 
     output_lines = [
         f"🎯 Run Evaluation: {run_id}",
@@ -1333,7 +1629,7 @@ def cmd_evaluate(args) -> Dict[str, Any]:
             output_lines.append(f"• ... and {len(recommendations) - 5} more")
 
     output_lines.append("")
-    output_lines.append("📁 Full report saved to: evaluations.md")
+    output_lines.append(f"📁 Evaluation saved to: {EVALUATIONS_JSONL}")
 
     # Replace the JSON result with formatted text
     result["_formatted_output"] = "\n".join(output_lines)
@@ -1384,8 +1680,7 @@ def cmd_summary(args) -> Dict[str, Any]:
                 "code": "NO_EVALUATION"
             }
 
-        with open(eval_file, 'r') as f:
-            evaluation = json.load(f)
+        evaluation = _json_loads(eval_file.read_bytes())
 
         return {
             "success": True,
@@ -1407,18 +1702,18 @@ def cmd_summary(args) -> Dict[str, Any]:
         }
 
         if runs:
-            success_count = sum(1 for r in runs if r.get("status") == "success")
-            summary["success_rate"] = success_count / len(runs)
-
-            quality_scores = [r.get("metrics", {}).get("quality_score", 0) for r in runs]
-            summary["avg_quality_score"] = sum(quality_scores) / len(quality_scores)
-
-            summary["total_duration_s"] = sum(r.get("duration_total_s", 0) for r in runs if r.get("duration_total_s"))
-
-            # Status breakdown
-            for run in runs:
-                status = run.get("status", "unknown")
-                summary["status_breakdown"][status] = summary["status_breakdown"].get(status, 0) + 1
+            # One pass for quality/duration totals; Counter for the status breakdown
+            quality_sum = 0.0
+            duration_sum = 0
+            for r in runs:
+                quality_sum += r.get("metrics", {}).get("quality_score", 0)
+                duration_sum += r.get("duration_total_s") or 0
+            status_counts = Counter(r.get("status", "unknown") for r in runs)
+
+            summary["success_rate"] = status_counts["success"] / len(runs)
+            summary["avg_quality_score"] = quality_sum / len(runs)
+            summary["total_duration_s"] = duration_sum
+            summary["status_breakdown"] = dict(status_counts)
 
         return {
             "success": True,
@@ -1431,13 +1726,18 @@ def cmd_dashboard(args) -> Dict[str, Any]:
     # Generate HTML dashboard of runs.
     runs = find_runs(limit=args.limit)
 
+    # Render evaluations.md from the store (the dashboard links into it)
+    evaluations = load_evaluations()
+    if evaluations:
+        with open(EVALUATIONS_MD, 'w') as f:
+            f.write(RunEvaluator.generate_central_evaluations_file(evaluations))
+
     # Generate HTML dashboard
     html_content = generate_html_dashboard(runs)
 
     # Write to file
     output_path = Path(args.output)
-    with open(output_path, 'w') as f:
-        f.write(html_content)
+    output_path.write_text(html_content)
 
     return {
         "success": True,
@@ -1447,24 +1747,42 @@ def cmd_dashboard(args) -> Dict[str, Any]:
     }
 
 
+# Dashboard page head, styles and table header
+_DASHBOARD_HEADER = (
+    '<!DOCTYPE html><html><head><meta charset="UTF-8"><title>Runs Dashboard</title>'
+    '<style>body{font-family:monospace;margin:0;padding:10px}'
+    'table{width:100%;border-collapse:collapse}'
+    'th,td{padding:8px;text-align:left;border-bottom:1px solid #ddd}'
+    'th{background:#f0f0f0;font-weight:bold}tr:hover{background:#f9f9f9}'
+    '.status-success{color:#0a0}.status-warning{color:#fa0}.status-error{color:#a00}'
+    'a{color:#0066cc;text-decoration:none}a:hover{text-decoration:underline}'
+    '</style></head><body><table><tr><th>Run ID</th><th>Status</th><th>Time</th><th>Quality</th></tr>'
+)
+
+# Dashboard table row: run_id, status class, emoji, status, time, quality
+_DASHBOARD_ROW = (
+    '<tr><td><a href="evaluations.md#{0}">{0}</a></td>'
+    '<td><span class="{1}">{2} {3}</span></td><td>{4}</td><td>{5:.2f}</td></tr>'
+).format
+
+# Color coding for status
+_STATUS_CLASS = {
+    "success": "status-success",
+    "partial_success": "status-warning",
+    "failure": "status-error"
+}
+
+
 def generate_html_dashboard(runs: List[Dict[str, Any]]) -> str:
     """Generate ultra-minimalistic HTML dashboard - just the table."""
-    html_parts = ['<!DOCTYPE html><html><head><meta charset="UTF-8"><title>Runs Dashboard</title>']
-    html_parts.append('<style>body{font-family:monospace;margin:0;padding:10px}')
-    html_parts.append('table{width:100%;border-collapse:collapse}')
-    html_parts.append('th,td{padding:8px;text-align:left;border-bottom:1px solid #ddd}')
-    html_parts.append('th{background:#f0f0f0;font-weight:bold}tr:hover{background:#f9f9f9}')
-    html_parts.append('.status-success{color:#0a0}.status-warning{color:#fa0}.status-error{color:#a00}')
-    html_parts.append('a{color:#0066cc;text-decoration:none}a:hover{text-decoration:underline}')
-    html_parts.append('</style></head><body><table><tr><th>Run ID</th><th>Status</th><th>Time</th><th>Quality</th></tr>')
-
-    # Status emoji mapping
-    status_emoji = {"success": "✅", "partial_success": "⚠️", "failure": "❌"}
+    buf = io.StringIO()
+    write = buf.write
+    write(_DASHBOARD_HEADER)
 
     for run in runs:
         run_id = run.get('run_id', 'unknown')
         status = run.get('status', 'unknown')
-        emoji = status_emoji.get(status, "❓")
+        emoji = _STATUS_EMOJI.get(status, "❓")
 
         timestamp = run.get('timestamp', '')
         if timestamp:
@@ -1478,17 +1796,15 @@ def generate_html_dashboard(runs: List[Dict[str, Any]]) -> str:
 
         quality_score = run.get('metrics', {}).get('quality_score', 0)
 
-        # Color coding for status
-        status_class = {
-            "success": "status-success",
-            "partial_success": "status-warning",
-            "failure": "status-error"
-        }.get(status, "status-unknown")
-
-        html_parts.append('<tr><td><a href="evaluations.md#{run_id}">{run_id}</a></td>'.format(run_id=run_id))
-        html_parts.append('<td><span class="{}">{}</span></td>'.format(status_class, emoji + " " + status.replace('_', ' ').title()))
-        html_parts.append('<td>{}</td>'.format(timestamp_display))
-        html_parts.append('<td>{:.2f}</td></tr>'.format(quality_score))
-
-    html_parts.append('</table></body></html>')
-    return ''.join(html_parts)
\ No newline at end of file
+        # One template call per row; run data is escaped before it reaches the HTML
+        write(_DASHBOARD_ROW(
+            html.escape(run_id),
+            _STATUS_CLASS.get(status, "status-unknown"),
+            emoji,
+            html.escape(status.replace('_', ' ').title()),
+            html.escape(timestamp_display),
+            quality_score,
+        ))
+
+    write('</table></body></html>')
+    return buf.getvalue()
\ No newline at end of file
@@ -14,12 +14,29 @@ TH TYPES:
 - Segment (video resolution): For standalone intro/middle/outro segments
 """
 
+import argparse
+import bisect
+import collections
+import functools
+import json
+import math
+import os
 import re
+import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from vg_tts import tts_with_json_output
 from vg_talking_head import generate_character, generate_talking_head, composite_talking_head
-from vg_common import validate_env_for_command, get_ffmpeg, get_duration
+from vg_common import (
+    validate_env_for_command, get_ffmpeg, get_ffprobe, get_duration, get_video_size, get_audio_codec, cached_duration,
+    quality_encoder_args, hw_decode_args, cache_key, get_cached, save_to_cache,
+    QUALITY_PRESETS, DEFAULT_QUALITY, CACHE_DIR
+)
 
 # Constants
 DEFAULT_VOICE_ID = '21m00Tcm4TlvDq8ikWAM'  # ElevenLabs Rachel voice
@@ -30,10 +47,6 @@ DEFAULT_VOICE_ID = '21m00Tcm4TlvDq8ikWAM'  # ElevenLabs Rachel voice
 # Common recording sizes: 1920x1080, 1280x720
 DEFAULT_RESOLUTION = (1920, 1080)
 
-# Fullscreen TH composition settings (YouTuber-style framing)
-CHAR_HEIGHT_RATIO = 0.6   # Character takes 60% of frame height
-CHAR_BOTTOM_MARGIN = 0.1  # 10% margin from bottom
-
 def register(subparsers):
     """Register talking-head commands."""
     th_parser = subparsers.add_parser('talking-head', help='Talking head operations')
@@ -57,6 +70,12 @@ def register(subparsers):
                                choices=['top-left', 'top-right', 'bottom-left', 'bottom-right'],
                                help='Overlay position')
     overlay_parser.add_argument('--size', type=int, default=280, help='Overlay size in pixels')
+    overlay_parser.add_argument('--threads', type=int, default=0,
+                               help='FFmpeg threads (default: all available CPUs; lower when running several in parallel)')
+    overlay_parser.add_argument('--no-faststart', '--fragmented', dest='faststart', action='store_false',
+                               help='Write a fragmented MP4 in one pass instead of moving the index to the front')
+    overlay_parser.add_argument('--quality', default=DEFAULT_QUALITY, choices=list(QUALITY_PRESETS),
+                               help='Encode speed/quality trade-off (default: balanced)')
     overlay_parser.set_defaults(func=cmd_overlay)
 
     # vg talking-head create - CONVENIENCE: TTS + generate in one step
@@ -78,6 +97,8 @@ def register(subparsers):
                            help='Overlay position')
     comp_parser.add_argument('--size', type=int, default=280, help='Overlay size in pixels')
     comp_parser.add_argument('--start-time', type=float, default=0, help='Start time in seconds')
+    comp_parser.add_argument('--quality', default=DEFAULT_QUALITY, choices=list(QUALITY_PRESETS),
+                           help='Encode speed/quality trade-off (default: balanced)')
     comp_parser.set_defaults(func=cmd_composite)
 
     # Helper to add segment args (reused for segment/intro/outro)
@@ -92,6 +113,12 @@ def register(subparsers):
         parser.add_argument('--voice-id', default=DEFAULT_VOICE_ID, help='ElevenLabs voice ID')
         parser.add_argument('--model', default='omnihuman', choices=['omnihuman', 'sadtalker'], 
                           help='Model to use')
+        parser.add_argument('--quality', default=DEFAULT_QUALITY, choices=list(QUALITY_PRESETS),
+                          help='Encode speed/quality trade-off (default: balanced)')
+        parser.add_argument('--fragmented', dest='faststart', action='store_false',
+                          help='Write a fragmented MP4 in one pass instead of moving the index to the front')
+        parser.add_argument('--threads', type=int, default=0,
+                          help='FFmpeg threads (default: all available CPUs; lower when running several in parallel)')
 
     # vg talking-head segment - Fullscreen TH at video resolution (for any position)
     segment_parser = th_sub.add_parser('segment', 
@@ -124,6 +151,13 @@ def register(subparsers):
                             help='Visual style for the title card')
     title_parser.set_defaults(func=cmd_title)
 
+    # vg talking-head batch - Several create/segment jobs with overlapping network calls
+    batch_parser = th_sub.add_parser('batch',
+        help='Run several create/segment jobs from a JSON file concurrently')
+    batch_parser.add_argument('--jobs', required=True, help='JSON file with an array of create/segment jobs')
+    batch_parser.add_argument('--workers', type=int, default=4, help='Jobs to run at once (default: 4)')
+    batch_parser.set_defaults(func=cmd_batch)
+
 def cmd_generate(args) -> dict:
     """Handle vg talking-head generate command."""
     # Validate environment
@@ -152,8 +186,6 @@ def cmd_create(args) -> dict:
     Returns:
         {"video": "th_intro.mp4", "audio": "th_intro.mp3", "duration_s": 2.1}
     """
-    from vg_tts import tts_with_json_output
-    
     # Validate environment (need both ElevenLabs and FAL)
     env_check = validate_env_for_command("talking-head.create")
     if not env_check["success"]:
@@ -165,15 +197,14 @@ def cmd_create(args) -> dict:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Step 1: Generate TTS
+    # Step 1: Generate TTS, and the character if not provided (as documented).
+    # Both are independent network calls, so they run concurrently
     text_preview = args.text[:50] + "..." if len(args.text) > 50 else args.text
     print(f"🎤 Generating TTS: \"{text_preview}\"")
+    if not args.character:
+        print("   🎭 Auto-generating character image...")
     
-    tts_result = tts_with_json_output(
-        text=args.text,
-        output_path=str(audio_path),
-        voice_id=args.voice_id
-    )
+    tts_result, char_result = _tts_and_character(args, audio_path, "portrait")
     
     if not tts_result.get("success"):
         return {
@@ -185,22 +216,15 @@ def cmd_create(args) -> dict:
     duration_s = tts_result.get("duration_s") or tts_result.get("duration") or 0
     print(f"   ✅ Audio: {audio_path.name} ({duration_s:.1f}s)")
     
-    # Step 2: Generate talking head
-    print(f"🎬 Generating talking head with {args.model}...")
-    
-    # Generate character if not provided (as documented)
     character = args.character
     if not character:
-        print("   🎭 Auto-generating character image...")
-        char_result = generate_character()
         if not char_result.get("success"):
-            return {
-                "success": False,
-                "error": f"Character generation failed: {char_result.get('error')}",
-                "code": char_result.get("code", "CHARACTER_ERROR")
-            }
+            return char_result
         character = char_result.get("image")
     
+    # Step 2: Generate talking head
+    print(f"🎬 Generating talking head with {args.model}...")
+    
     th_result = generate_talking_head(
         audio_path=str(audio_path),
         output_path=str(output_path),
@@ -227,6 +251,41 @@ def cmd_create(args) -> dict:
     }
 
 
+def _auto_character(style: str) -> dict:
+    """
+    Presenter image for runs without --character, as a command result dict.
+    
+    generate_character_image() keeps one image per style on disk and reuses it,
+    so only the first create/segment run per style calls the image model.
+    """
+    char_result = generate_character(style=style)
+    if not char_result.get("success"):
+        return {
+            "success": False,
+            "error": f"Character generation failed: {char_result.get('error')}",
+            "code": char_result.get("code", "CHARACTER_ERROR")
+        }
+    return char_result
+
+
+def _tts_and_character(args, audio_path: Path, style: str) -> tuple:
+    """
+    Run TTS and, without --character, the character lookup concurrently.
+    
+    Returns:
+        (tts_result, char_result); char_result is None when --character was given
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tts_future = pool.submit(
+            tts_with_json_output,
+            text=args.text,
+            output_path=str(audio_path),
+            voice_id=args.voice_id
+        )
+        char_future = None if args.character else pool.submit(_auto_character, style)
+        return tts_future.result(), (char_future.result() if char_future else None)
+
+
 def cmd_composite(args) -> dict:
     """Handle vg talking-head composite command."""
     return composite_talking_head(
@@ -235,7 +294,8 @@ def cmd_composite(args) -> dict:
         output_path=args.output,
         position=args.position,
         size=args.size,
-        start_time=args.start_time
+        start_time=args.start_time,
+        quality=args.quality
     )
 
 
@@ -275,37 +335,39 @@ def cmd_overlay(args) -> dict:
             }
         
         # Parse overlay placements: "file.mp4:47.6" -> (file, start_time)
-        overlays = []
+        placements = []
         for overlay_spec in args.overlay:
-            if ':' not in overlay_spec:
+            try:
+                placements.append(_parse_overlay_spec(overlay_spec))
+            except ValueError as e:
                 return {
                     "success": False,
-                    "error": f"Invalid overlay format: '{overlay_spec}'. Use 'file.mp4:start_time'",
+                    "error": str(e),
                     "code": "VALIDATION_ERROR"
                 }
-            
-            file_part, time_part = overlay_spec.rsplit(':', 1)
-            overlay_file = Path(file_part)
-            
-            if not overlay_file.exists():
+        
+        # Stat and probe each distinct overlay file once, in parallel (same TH may be
+        # placed several times); the stat doubles as the existence check and cache key
+        unique_files = list(dict.fromkeys(f for f, _ in placements))
+        # The main video's duration and audio codec are probed in the same pool
+        with ThreadPoolExecutor(max_workers=min(16, len(unique_files) + 2)) as pool:
+            main_duration = pool.submit(cached_duration, video_path)
+            main_audio = pool.submit(get_audio_codec, video_path)
+            probed = dict(zip(unique_files, pool.map(_stat_and_duration, unique_files)))
+            video_duration = main_duration.result()
+            audio_codec = main_audio.result()
+        
+        for overlay_file in unique_files:
+            if probed[overlay_file] is None:
                 return {
                     "success": False,
                     "error": f"Overlay file not found: {overlay_file}",
                     "code": "FILE_NOT_FOUND"
                 }
-            
-            try:
-                start_time = float(time_part)
-            except ValueError:
-                return {
-                    "success": False,
-                    "error": f"Invalid time value: '{time_part}' in '{overlay_spec}'",
-                    "code": "VALIDATION_ERROR"
-                }
-            
-            # Get overlay duration
-            duration = get_duration(overlay_file)
-            
+        
+        overlays = []
+        for overlay_file, start_time in placements:
+            duration = probed[overlay_file]
             overlays.append({
                 "file": str(overlay_file),
                 "start_s": start_time,
@@ -322,126 +384,128 @@ def cmd_overlay(args) -> dict:
         
         # Sort overlays by start time
         overlays.sort(key=lambda x: x["start_s"])
+        starts = [o["start_s"] for o in overlays]
         
-        # Validate overlay times against video duration
-        video_duration = get_duration(video_path)
-        warnings = []
+        # Validate overlay times against video duration. The list is sorted, so the
+        # range checks only look at its ends and the skipped tail is found by bisection
+        if starts[0] < 0:
+            return {
+                "success": False,
+                "error": f"Overlay start time cannot be negative ({starts[0]:.1f}s)",
+                "code": "VALIDATION_ERROR"
+            }
+        
+        if starts[-1] > video_duration:
+            first_late = starts[bisect.bisect_right(starts, video_duration)]
+            return {
+                "success": False,
+                "error": f"Overlay start time ({first_late:.1f}s) exceeds video duration ({video_duration:.1f}s)",
+                "code": "VALIDATION_ERROR",
+                "suggestion": f"Use a start time less than {video_duration:.1f}s"
+            }
+        
+        # Starts exactly at the end: nothing would render, so don't open them at all
+        in_range = bisect.bisect_left(starts, video_duration)
+        skipped = overlays[in_range:]
+        overlays = overlays[:in_range]
         
+        warnings = []
         for o in overlays:
-            if o["start_s"] > video_duration:
-                return {
-                    "success": False,
-                    "error": f"Overlay start time ({o['start_s']:.1f}s) exceeds video duration ({video_duration:.1f}s)",
-                    "code": "VALIDATION_ERROR",
-                    "suggestion": f"Use a start time less than {video_duration:.1f}s"
-                }
-            
-            if o["start_s"] < 0:
-                return {
-                    "success": False,
-                    "error": f"Overlay start time cannot be negative ({o['start_s']:.1f}s)",
-                    "code": "VALIDATION_ERROR"
-                }
-            
             if o["end_s"] > video_duration:
                 warnings.append(
                     f"TH '{Path(o['file']).name}' extends past video end "
                     f"({o['end_s']:.1f}s > {video_duration:.1f}s) - will be clipped"
                 )
+                o["end_s"] = video_duration
+                o["duration_s"] = video_duration - o["start_s"]
+        warnings += [f"TH '{Path(o['file']).name}' starts at video end - skipped" for o in skipped]
+        
+        if not overlays:
+            # Nothing would be drawn: copy the streams instead of re-encoding an identical video
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            returncode, stderr = _run_ffmpeg([ffmpeg, "-y", "-i", str(video_path), "-map", "0", "-c", "copy",
+                                              str(output_path)])
+            if returncode != 0:
+                return {
+                    "success": False,
+                    "error": f"FFmpeg failed: {stderr[:500]}",
+                    "code": "FFMPEG_ERROR"
+                }
+            sys.stdout.write("".join(f"⚠️  {w}\n" for w in warnings))
+            return {
+                "success": True,
+                "video": str(output_path),
+                "duration_s": video_duration,
+                "overlays": [],
+                "overlays_applied": 0,
+                "position": args.position,
+                "size": args.size,
+                "cached": False
+            }
         
         if warnings:
-            for w in warnings:
-                print(f"⚠️  {w}")
+            sys.stdout.write("".join(f"⚠️  {w}\n" for w in warnings))
         
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Calculate position offset
         position = args.position
         size = args.size
         
-        if "right" in position:
-            x_offset = f"main_w-overlay_w-20"
-        else:
-            x_offset = "20"
+        # One write for the whole listing rather than a print per overlay
+        sys.stdout.write("".join([
+            f"🎬 Overlaying {len(overlays)} talking head(s) at AI-specified times:\n",
+            *(f"   {Path(o['file']).name}: {o['start_s']:.2f}s - {o['end_s']:.2f}s ({o['duration_s']:.1f}s)\n"
+              for o in overlays)
+        ]))
         
-        if "bottom" in position:
-            y_offset = f"main_h-overlay_h-20"
-        else:
-            y_offset = "20"
+        # Filtergraph + encoder threads. Defaults to the CPUs this process may run on;
+        # an orchestrator running K ffmpeg jobs at once should pass --threads cpus // K
+        threads = str(args.threads or _available_cpus())
+        video_codec = quality_encoder_args(ffmpeg, args.quality)
+        movflags = _movflags(args)
         
-        print(f"🎬 Overlaying {len(overlays)} talking head(s) at AI-specified times:")
-        for o in overlays:
-            print(f"   {Path(o['file']).name}: {o['start_s']:.2f}s - {o['end_s']:.2f}s ({o['duration_s']:.1f}s)")
-        
-        # For a single overlay, use simple approach
-        if len(overlays) == 1:
-            o = overlays[0]
-            filter_complex = (
-                f"[1:v]scale={size}:{size}:force_original_aspect_ratio=decrease[ovr];"
-                f"[0:v][ovr]overlay={x_offset}:{y_offset}:enable='between(t,{o['start_s']},{o['end_s']})'[vout]"
-            )
-            
-            cmd = [
-                ffmpeg, "-y",
-                "-i", str(video_path),
-                "-itsoffset", str(o['start_s']),  # CRITICAL: Delay TH input to sync with overlay time
-                "-i", o["file"],
-                "-filter_complex", filter_complex,
-                "-map", "[vout]",
-                "-map", "0:a?",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "20",
-                "-c:a", "copy",
-                "-movflags", "+faststart",
-                str(output_path)
-            ]
+        # Same inputs and settings give the same output: reuse a previous render
+        result_key = _overlay_cache_key(ffmpeg, video_path, overlays, size, position, video_codec, movflags)
+        cached_path = get_cached(OVERLAY_CACHE_TYPE, result_key)
+        
+        if cached_path:
+            shutil.copy(cached_path, output_path)
+            cached = True
         else:
-            # Multiple overlays - chain them
-            # Build complex filter that applies overlays sequentially
-            # CRITICAL: Each TH input needs -itsoffset to sync frame 0 with overlay start time
-            inputs = ["-i", str(video_path)]
-            for o in overlays:
-                inputs.extend(["-itsoffset", str(o['start_s']), "-i", o["file"]])
+            # Render from size-normalized copies of the overlays (cached across runs) so the
+            # filtergraph does not rescale every overlay frame on every invocation
+            render_overlays = _prescaled_overlays(ffmpeg, overlays, size)
             
-            # Scale all overlays
-            filter_parts = []
-            for i in range(len(overlays)):
-                filter_parts.append(f"[{i+1}:v]scale={size}:{size}:force_original_aspect_ratio=decrease[ovr{i}]")
+            # Overlays usually cover short windows: re-encode only those, stream-copy the rest
+            if not _overlay_windowed(ffmpeg, video_path, render_overlays, output_path, video_duration,
+                                     size, position, threads, video_codec, movflags, audio_codec):
+                # Full re-encode. CRITICAL: each TH input gets -itsoffset to sync frame 0 with its start time
+                cmd = [
+                    ffmpeg, "-y",
+                    *hw_decode_args(ffmpeg), "-i", str(video_path),
+                    *_overlay_inputs(render_overlays),
+                    "-filter_complex_threads", threads, "-threads", threads,
+                    "-filter_complex_script", _overlay_filter_script(render_overlays, size, position),
+                    "-map", "[vout]",
+                    *_audio_args(audio_codec, 0),
+                    *video_codec,
+                    "-movflags", movflags,
+                    str(output_path)
+                ]
             
-            # Chain overlays
-            prev_output = "[0:v]"
-            for i, o in enumerate(overlays):
-                if i == len(overlays) - 1:
-                    out_label = "[vout]"
-                else:
-                    out_label = f"[v{i}]"
-                filter_parts.append(
-                    f"{prev_output}[ovr{i}]overlay={x_offset}:{y_offset}:enable='between(t,{o['start_s']},{o['end_s']})'{out_label}"
-                )
-                prev_output = out_label
+                returncode, stderr = _run_ffmpeg(cmd)
             
-            filter_complex = ";".join(filter_parts)
+                if returncode != 0:
+                    return {
+                        "success": False,
+                        "error": f"FFmpeg failed: {stderr[:500]}",
+                        "code": "FFMPEG_ERROR"
+                    }
             
-            cmd = [
-                ffmpeg, "-y",
-                *inputs,
-                "-filter_complex", filter_complex,
-                "-map", "[vout]",
-                "-map", "0:a?",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "20",
-                "-c:a", "copy",
-                "-movflags", "+faststart",
-                str(output_path)
-            ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-        
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "error": f"FFmpeg failed: {result.stderr[:500]}",
-                "code": "FFMPEG_ERROR"
-            }
+            if output_path.stat().st_size <= OVERLAY_CACHE_MAX_BYTES:
+                save_to_cache(OVERLAY_CACHE_TYPE, result_key, output_path, {"video": str(video_path)})
+            cached = False
         
         # Get output duration
         output_duration = get_duration(output_path)
@@ -455,7 +519,8 @@ def cmd_overlay(args) -> dict:
             "overlays": overlays,
             "overlays_applied": len(overlays),
             "position": position,
-            "size": size
+            "size": size,
+            "cached": cached
         }
     
     except Exception as e:
@@ -466,114 +531,544 @@ def cmd_overlay(args) -> dict:
         }
 
 
-def _get_video_resolution(video_path: str) -> tuple:
-    """Get video resolution (width, height) using ffmpeg."""
-    ffmpeg = get_ffmpeg()
-    result = subprocess.run(
-        [ffmpeg, "-i", video_path],
-        capture_output=True, text=True
+def _stat_and_duration(path: Path):
+    """Duration of an existing file (cached by its stat), or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return cached_duration(path, st)
+
+
+def _parse_overlay_spec(overlay_spec: str) -> tuple:
+    """
+    Split an overlay placement "file.mp4:47.6" into (Path, start seconds).
+    
+    The last colon separates the time, so paths with drive letters or colons still
+    parse; the time accepts anything float() does (e.g. "1e3", ".5", "+2") except
+    inf/nan.
+    
+    Raises:
+        ValueError: with the user-facing message for a malformed spec
+    """
+    file_part, sep, time_part = overlay_spec.rpartition(':')
+    if not sep:
+        raise ValueError(f"Invalid overlay format: '{overlay_spec}'. Use 'file.mp4:start_time'")
+    try:
+        start_time = float(time_part)
+    except ValueError:
+        start_time = math.nan
+    if not math.isfinite(start_time):
+        raise ValueError(f"Invalid time value: '{time_part}' in '{overlay_spec}'")
+    return Path(file_part), start_time
+
+
+def _movflags(args) -> str:
+    """
+    MP4 -movflags for the output: +faststart unless --fragmented/--no-faststart.
+    
+    +faststart rewrites the whole file after encoding to move the index up front;
+    a fragmented MP4 carries its header first and is written in a single pass
+    (fine for streaming and local edit pipelines, less so for some editors).
+    """
+    if getattr(args, "faststart", True):
+        return "+faststart"
+    return "+frag_keyframe+empty_moov+default_base_moof"
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects affinity/cgroup pinning where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS/Windows
+        return os.cpu_count() or 4
+
+
+def _run_ffmpeg(cmd: list, timeout: int = 600) -> tuple:
+    """
+    Run an ffmpeg command with errors-only logging, keeping just the tail of stderr.
+    
+    Unlike capture_output, memory stays bounded however long the encode runs.
+    
+    Returns:
+        (returncode, stderr_tail)
+    
+    Raises:
+        subprocess.TimeoutExpired: If ffmpeg runs past timeout (the process is killed)
+    """
+    cmd = [cmd[0], "-hide_banner", "-loglevel", "error", "-nostats", *cmd[1:]]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    tail = collections.deque(maxlen=64)
+    reader = threading.Thread(target=tail.extend, args=(proc.stderr,), daemon=True)
+    reader.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        reader.join()
+    return proc.returncode, "".join(tail)
+
+
+# Seek/trim tolerance around keyframe timestamps (ffprobe prints them rounded to 1us)
+_CUT_EPS = 0.0005
+
+
+# Input options for MP4s the pipeline wrote itself (split parts, prescaled overlays): a
+# short stream probe is enough to find their streams, instead of FFmpeg's default 5MB/5s
+# per input. User-supplied files (--video, raw overlays) keep the default probing
+_FAST_PROBE = ["-probesize", "1M", "-analyzeduration", "1M", "-fflags", "+genpts+discardcorrupt"]
+
+
+def _fmt_time(seconds: float) -> str:
+    """Fixed-precision seconds for FFmpeg args (stable strings, no float repr noise)."""
+    return f"{seconds:.6f}"
+
+
+def _overlay_inputs(overlays: list, t0: float = 0.0) -> list:
+    """
+    FFmpeg input args for the overlay videos, each delayed to its start time (relative to t0).
+    
+    The offset input carries the timing: it has no frames before its start and the
+    overlay uses eof_action=pass after its end, so no per-frame enable test is needed.
+    Each input is read only for duration_s (already clipped to the main video).
+    """
+    inputs = []
+    for o in overlays:
+        inputs.extend([
+            *(_FAST_PROBE if o.get("generated") else []),
+            "-itsoffset", _fmt_time(o["start_s"] - t0),
+            "-t", _fmt_time(o["duration_s"]),
+            "-i", o["file"]
+        ])
+    return inputs
+
+
+def _overlay_filter(overlays: list, size: int, position: str) -> str:
+    """Filtergraph placing the (time-offset) overlay inputs over [0:v] into [vout]."""
+    return _overlay_filter_graph(tuple(bool(o.get("prescaled")) for o in overlays), size, position)
+
+
+@functools.lru_cache(maxsize=None)
+def _overlay_filter_graph(prescaled: tuple, size: int, position: str) -> str:
+    """
+    Build the overlay filtergraph; it depends only on the layout, not on timings.
+    
+    Overlays marked prescaled are used as-is; the rest are scaled in the graph.
+    With several overlays, each is composited onto its own transparent size x size
+    layer cut from [0:v] (so it shares the main timestamps); the layers are merged
+    pairwise and the result is overlaid on the main video once instead of running
+    N full-frame overlay passes.
+    """
+    margin = 20
+    x_offset = f"main_w-overlay_w-{margin}" if "right" in position else str(margin)
+    y_offset = f"main_h-overlay_h-{margin}" if "bottom" in position else str(margin)
+    
+    # Scale overlays that were not prescaled. The scaled stream must reach overlay's
+    # second pad through a label (a chain only feeds the first); labeled links pass
+    # frames by reference, so this costs no extra copy
+    filter_parts = []
+    labels = []
+    for i, is_prescaled in enumerate(prescaled):
+        if is_prescaled:
+            labels.append(f"[{i+1}:v]")
+        else:
+            filter_parts.append(f"[{i+1}:v]scale={size}:{size}:force_original_aspect_ratio=decrease[ovr{i}]")
+            labels.append(f"[ovr{i}]")
+    
+    if len(prescaled) == 1:
+        filter_parts.append(f"[0:v]{labels[0]}overlay={x_offset}:{y_offset}:eof_action=pass[vout]")
+        return ";".join(filter_parts)
+    
+    # Align each overlay inside the canvas toward the corner it is pinned to
+    canvas_x = "main_w-overlay_w" if "right" in position else "0"
+    canvas_y = "main_h-overlay_h" if "bottom" in position else "0"
+    n = len(prescaled)
+    filter_parts.append("[0:v]split=2[main][ref]")
+    filter_parts.append(
+        f"[ref]crop=w='min(iw,{size})':h='min(ih,{size})':x=0:y=0,"
+        f"format=yuva420p,lutyuv=a=0,split={n}" + "".join(f"[b{i}]" for i in range(n))
     )
     
-    # Look for video stream resolution - match "WIDTHxHEIGHT" after "Video:" line
-    # Handles common resolutions: 640x480, 1280x720, 1920x1080, 3840x2160, etc.
-    video_match = re.search(r'Video:.*?(\d{3,5})x(\d{3,5})', result.stderr)
-    if video_match:
-        return int(video_match.group(1)), int(video_match.group(2))
+    # One independent layer per overlay, so the branches can run on separate threads
+    layers = []
+    for i in range(n):
+        filter_parts.append(f"[b{i}]{labels[i]}overlay={canvas_x}:{canvas_y}:eof_action=pass[l{i}]")
+        layers.append(f"[l{i}]")
     
-    # Warn and fall back to default
-    print(f"   ⚠️  Could not detect resolution for {Path(video_path).name}, using default {DEFAULT_RESOLUTION[0]}x{DEFAULT_RESOLUTION[1]}")
-    return DEFAULT_RESOLUTION
+    # Merge layers pairwise (later overlays on top): log2(N) deep instead of an N-long chain
+    merges = 0
+    while len(layers) > 1:
+        merged = []
+        for j in range(0, len(layers) - 1, 2):
+            filter_parts.append(f"{layers[j]}{layers[j+1]}overlay[m{merges}]")
+            merged.append(f"[m{merges}]")
+            merges += 1
+        if len(layers) % 2:
+            merged.append(layers[-1])
+        layers = merged
+    filter_parts.append(f"[main]{layers[0]}overlay={x_offset}:{y_offset}[vout]")
+    
+    return ";".join(filter_parts)
+
+
+def _overlay_filter_script(overlays: list, size: int, position: str) -> str:
+    """
+    Path of a file holding the overlay filtergraph, for -filter_complex_script.
+    
+    Files are named by content under the vg cache, so runs with the same layout
+    reuse one script instead of rebuilding and passing the graph on the command line.
+    """
+    graph = _overlay_filter(overlays, size, position)
+    script = CACHE_DIR / "filters" / f"{cache_key(graph)}.filter"
+    if not script.exists():
+        script.parent.mkdir(parents=True, exist_ok=True)
+        tmp = script.with_name(f"{script.name}.{os.getpid()}.tmp")
+        tmp.write_text(graph)
+        os.replace(tmp, script)
+    return str(script)
 
 
-def _compose_fullscreen_th(
-    th_video: str,
-    output_path: str,
-    resolution: tuple,
-    background: str = "gradient"
+# vg cache type for finished overlay renders. Each entry is a second copy of a full
+# output video and nothing evicts it before expiry, so larger renders are not cached
+OVERLAY_CACHE_TYPE = "th_overlay"
+OVERLAY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _overlay_cache_key(
+    ffmpeg: str,
+    video_path: Path,
+    overlays: list,
+    size: int,
+    position: str,
+    video_codec: list,
+    movflags: str
 ) -> str:
+    """Cache key for an overlay render: files by (path, mtime, size), placements and output settings."""
+    def identity(path) -> str:
+        st = os.stat(path)
+        return f"{Path(path).resolve()}:{st.st_mtime_ns}:{st.st_size}"
+    
+    parts = [identity(video_path)]
+    for o in overlays:
+        parts.append(f"{identity(o['file'])}@{_fmt_time(o['start_s'])}+{_fmt_time(o['duration_s'])}")
+    parts += [str(size), position, ffmpeg, *video_codec, movflags]
+    return cache_key("|".join(parts))
+
+
+# vg cache type for size-normalized overlay videos
+PRESCALE_CACHE_TYPE = "th_prescaled"
+
+
+def _ensure_prescaled(ffmpeg: str, overlay_file: str, size: int):
     """
-    Compose square TH into fullscreen video at target resolution.
+    Get a size-normalized, audio-free copy of an overlay video from the vg cache.
     
-    Places the TH character naturally (like a YouTuber video) on a background.
-    Character is NOT enlarged to fill the frame - uses natural sizing.
+    Keyed by (path, mtime, size on disk, overlay size); encoded on first use.
     
-    Args:
-        th_video: Path to square TH video
-        output_path: Path for output video
-        resolution: Target (width, height) tuple
-        background: Background style ('black', 'gradient', 'blur')
+    A file that is already size x size (e.g. from `create`) is used directly.
     
     Returns:
-        Path to output video
+        Path to the cached copy (or the file itself), or None if it could not be produced
     """
-    ffmpeg = get_ffmpeg()
-    target_w, target_h = resolution
+    st = os.stat(overlay_file)
+    key = cache_key(str(Path(overlay_file).resolve()), st.st_mtime_ns, st.st_size, size)
+    cached = get_cached(PRESCALE_CACHE_TYPE, key)
+    if cached:
+        return cached
     
-    # Get TH video dimensions (should be square, e.g., 960x960)
-    th_w, th_h = _get_video_resolution(th_video)
+    if _get_video_resolution(overlay_file) == (size, size):
+        return Path(overlay_file)
     
-    # Calculate character size - natural framing, not filling the screen
-    char_height = int(target_h * CHAR_HEIGHT_RATIO)
-    char_width = int(char_height * (th_w / th_h))  # Maintain aspect ratio
+    with tempfile.TemporaryDirectory(prefix=".vg_prescale_") as tmp:
+        scaled = Path(tmp) / "scaled.mp4"
+        cmd = [
+            ffmpeg, "-y",
+            "-i", overlay_file,
+            "-vf", f"scale={size}:{size}:force_original_aspect_ratio=decrease,setsar=1",
+            "-an",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+            str(scaled)
+        ]
+        if _run_ffmpeg(cmd)[0] != 0:
+            return None
+        return save_to_cache(PRESCALE_CACHE_TYPE, key, scaled, {"overlay_size": size})
+
+
+def _prescaled_overlays(ffmpeg: str, overlays: list, size: int) -> list:
+    """Copies of the overlay dicts pointing at prescaled files (falling back to in-graph scaling)."""
+    prescaled = {}
+    for f in dict.fromkeys(o["file"] for o in overlays):
+        try:
+            prescaled[f] = _ensure_prescaled(ffmpeg, f, size)
+        except Exception:
+            prescaled[f] = None
     
-    # Center horizontally, position in lower portion of frame (like YouTuber)
-    x_pos = (target_w - char_width) // 2
-    y_pos = target_h - char_height - int(target_h * CHAR_BOTTOM_MARGIN)
+    render = []
+    for o in overlays:
+        cached = prescaled[o["file"]]
+        if cached:
+            # A file already at the target size is used as-is, so it is still the user's file
+            render.append({**o, "file": str(cached), "prescaled": True,
+                           "generated": Path(cached) != Path(o["file"])})
+        else:
+            render.append(dict(o))
+    return render
+
+
+def _probe_keyframes(video_path: Path) -> tuple:
+    """Return (codec_name, pix_fmt, keyframe_times) of the first video stream, or (None, None, [])."""
+    ffprobe = get_ffprobe()
+    if not ffprobe:
+        return None, None, []
+    try:
+        result = subprocess.run([
+            ffprobe, "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=codec_name,pix_fmt:packet=pts_time,flags",
+            "-of", "compact=p=0",
+            str(video_path)
+        ], capture_output=True, text=True, timeout=60)
+    except Exception:
+        return None, None, []
     
-    output = Path(output_path)
-    output.parent.mkdir(parents=True, exist_ok=True)
+    codec = pix_fmt = None
+    keyframes = []
+    for line in result.stdout.splitlines():
+        fields = dict(kv.split("=", 1) for kv in line.split("|") if "=" in kv)
+        if "codec_name" in fields:
+            codec, pix_fmt = fields["codec_name"], fields.get("pix_fmt")
+        elif "K" in fields.get("flags", ""):
+            try:
+                keyframes.append(float(fields["pts_time"]))
+            except (KeyError, ValueError):
+                pass
+    keyframes.sort()
+    return codec, pix_fmt, keyframes
+
+
+def _h264_stream_info(video_path: Path):
+    """
+    Splice-relevant parameters of the first video stream, or None if they can't be probed.
     
-    # Build filter based on background style
-    if background == "black":
-        # Simple black background
-        filter_complex = (
-            f"color=black:s={target_w}x{target_h}:d=9999[bg];"
-            f"[1:v]scale={char_width}:{char_height}[th];"
-            f"[bg][th]overlay={x_pos}:{y_pos}:shortest=1[vout]"
-        )
-    elif background == "gradient":
-        # Gradient background (dark blue to dark)
-        filter_complex = (
-            f"gradients=s={target_w}x{target_h}:c0=0x1a1a2e:c1=0x16213e:x0=0:y0=0:x1=0:y1={target_h}:d=9999[bg];"
-            f"[1:v]scale={char_width}:{char_height}[th];"
-            f"[bg][th]overlay={x_pos}:{y_pos}:shortest=1[vout]"
-        )
-    else:  # blur
-        # Blurred version of the TH as background
-        filter_complex = (
-            f"[1:v]scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
-            f"crop={target_w}:{target_h},boxblur=20:20[bg];"
-            f"[1:v]scale={char_width}:{char_height}[th];"
-            f"[bg][th]overlay={x_pos}:{y_pos}:shortest=1[vout]"
-        )
+    extradata_hash covers the avcC box (SPS/PPS): an MP4 track has a single one, so
+    parts joined by stream copy must all carry the same.
+    """
+    ffprobe = get_ffprobe()
+    if not ffprobe:
+        return None
+    try:
+        result = subprocess.run([
+            ffprobe, "-v", "error",
+            "-select_streams", "v:0",
+            "-show_data_hash", "MD5",
+            "-show_entries", "stream=codec_name,profile,level,width,height,pix_fmt,time_base,extradata_hash",
+            "-of", "json",
+            str(video_path)
+        ], capture_output=True, text=True, timeout=30)
+        stream = json.loads(result.stdout)["streams"][0]
+    except Exception:
+        return None
+    if not stream.get("extradata_hash"):
+        return None
+    return stream
+
+
+# ffprobe profile names -> libx264 -profile:v
+_X264_PROFILES = {"Constrained Baseline": "baseline", "Baseline": "baseline", "Main": "main", "High": "high"}
+
+
+def _matching_x264_args(info: dict) -> list:
+    """libx264 args pinning profile, level and MP4 timescale to those of a source part."""
+    args = []
+    profile = _X264_PROFILES.get(info.get("profile"))
+    if profile:
+        args += ["-profile:v", profile]
+    level = info.get("level")
+    if isinstance(level, int) and level > 0:
+        args += ["-level:v", f"{level // 10}.{level % 10}"]
+    num, _, den = str(info.get("time_base", "")).partition("/")
+    if num == "1" and den.isdigit():
+        args += ["-video_track_timescale", den]
+    return args
+
+
+# Audio codecs the MP4 muxer takes as-is; anything else is transcoded to AAC
+_MP4_AUDIO_CODECS = {"aac", "mp3", "ac3", "eac3", "alac"}
+
+
+def _audio_args(audio_codec, input_index: int) -> list:
+    """
+    -map/-c:a args carrying the main video's audio (input input_index) into the MP4 output.
+    
+    audio_codec comes from get_audio_codec(): "" (no audio) maps nothing, and None
+    (not probed) keeps the optional map with a stream copy.
+    """
+    if audio_codec == "":
+        return []
+    if audio_codec is None or audio_codec in _MP4_AUDIO_CODECS:
+        return ["-map", f"{input_index}:a?", "-c:a", "copy"]
+    return ["-map", f"{input_index}:a", "-c:a", "aac", "-b:a", "192k"]
+
+
+def _overlay_windowed(
+    ffmpeg: str,
+    video_path: Path,
+    overlays: list,
+    output_path: Path,
+    video_duration: float,
+    size: int,
+    position: str,
+    threads: str,
+    video_codec: list,
+    movflags: str = "+faststart",
+    audio_codec: str = None
+) -> bool:
+    """
+    Overlay by re-encoding only the keyframe-aligned spans that overlays touch.
+    
+    The main video is split at keyframes into [gap, window, gap, ...] in a single
+    stream-copy pass of the segment muxer; only the window parts are re-encoded with
+    their overlays, and the parts are joined with the concat demuxer (video) plus the
+    untouched main audio.
+    
+    The joined MP4 keeps a single set of H.264 parameters (avcC), so the windows are
+    encoded with the source's profile, level and timescale and each one must come out
+    with the same SPS/PPS as the copied parts; otherwise the splice would not decode
+    past the first boundary and the caller re-encodes in full instead.
+    
+    Returns:
+        True if output_path was written, False if the caller should re-encode in full
+        (no ffprobe, a hardware encoder, non-H.264/yuv420p source, nothing to copy,
+        windows that don't match the source's stream parameters, or any FFmpeg failure).
+    """
+    # Hardware encoders never reproduce a libx264/camera SPS/PPS: don't even try
+    if video_codec[:2] != ["-c:v", "libx264"]:
+        return False
+    
+    codec, pix_fmt, keyframes = _probe_keyframes(video_path)
+    if codec != "h264" or pix_fmt != "yuv420p" or not keyframes:
+        return False
+    
+    # Snap each overlay out to the surrounding keyframes; merge spans that collide.
+    # A window ending at None runs to the end of the main video.
+    windows = []
+    for o in overlays:
+        i = bisect.bisect_right(keyframes, o["start_s"] + _CUT_EPS) - 1
+        if i < 0:
+            return False
+        start = keyframes[i]
+        j = bisect.bisect_left(keyframes, o["end_s"] - _CUT_EPS)
+        end = keyframes[j] if j < len(keyframes) and keyframes[j] < video_duration else None
+        if windows and (windows[-1]["end"] is None or start < windows[-1]["end"] - _CUT_EPS):
+            last = windows[-1]
+            last["overlays"].append(o)
+            if last["end"] is not None and (end is None or end > last["end"]):
+                last["end"] = end
+        else:
+            windows.append({"start": start, "end": end, "overlays": [o]})
     
-    cmd = [
-        ffmpeg, "-y",
-        "-f", "lavfi", "-i", f"color=black:s={target_w}x{target_h}:d=1",  # Dummy for gradients
-        "-i", th_video,
-        "-filter_complex", filter_complex,
-        "-map", "[vout]",
-        "-map", "1:a?",  # Keep TH audio if present
-        "-c:v", "libx264", "-preset", "medium", "-crf", "20",
-        "-c:a", "aac", "-b:a", "192k",
-        "-pix_fmt", "yuv420p",
-        "-movflags", "+faststart",
-        str(output)
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-    
-    if result.returncode != 0:
-        # Fallback to simpler approach if gradient filter not available
-        # Check for specific filter errors (e.g., "No such filter", "Unknown filter")
-        if background == "gradient" and ("No such filter" in result.stderr or 
-                                          "Unknown filter" in result.stderr or
-                                          "gradients" in result.stderr.lower()):
-            print("   ⚠️  Gradient filter not available, using black background")
-            return _compose_fullscreen_th(th_video, output_path, resolution, "black")
-        raise RuntimeError(f"FFmpeg failed: {result.stderr[:500]}")
-    
-    return str(output)
+    # Pieces in timeline order: ("copy", start) or ("encode", window); each runs to the next start
+    pieces = []
+    cursor = 0.0
+    for w in windows:
+        if w["start"] > cursor + _CUT_EPS:
+            pieces.append(("copy", cursor))
+        pieces.append(("encode", w))
+        cursor = w["end"]
+        if cursor is None:
+            break
+    if cursor is not None and video_duration > cursor + _CUT_EPS:
+        pieces.append(("copy", cursor))
+    if not any(kind == "copy" for kind, _ in pieces):
+        return False
+    
+    with tempfile.TemporaryDirectory(prefix=".vg_overlay_", dir=output_path.parent) as tmp:
+        tmp_dir = Path(tmp)
+        
+        # One stream-copy pass (no decode) splits the video at every cut; the segment
+        # muxer cuts at the first keyframe at/after each time, so aim just below it
+        cuts = [(w["start"] if kind == "encode" else w) for kind, w in pieces[1:]]
+        cmd = [
+            ffmpeg, "-y",
+            "-i", str(video_path),
+            "-map", "0:v:0", "-c", "copy",
+            "-f", "segment",
+            "-segment_times", ",".join(_fmt_time(t - _CUT_EPS) for t in cuts),
+            "-reset_timestamps", "1",
+            str(tmp_dir / "part%03d.mp4")
+        ]
+        if _run_ffmpeg(cmd)[0] != 0:
+            return False
+        parts = sorted(tmp_dir.glob("part*.mp4"))
+        if len(parts) != len(pieces):
+            return False
+        
+        source_info = _h264_stream_info(next(p for p, (kind, _) in zip(parts, pieces) if kind == "copy"))
+        if source_info is None:
+            return False
+        
+        # Re-encode only the parts under an overlay; each part starts at its keyframe (t=0)
+        names = []
+        for part, (kind, w) in zip(parts, pieces):
+            if kind == "copy":
+                names.append(part.name)
+                continue
+            encoded = tmp_dir / f"overlay_{part.name}"
+            cmd = [
+                ffmpeg, "-y",
+                *_FAST_PROBE, "-i", str(part),
+                *_overlay_inputs(w["overlays"], w["start"]),
+                "-filter_complex_threads", threads, "-threads", threads,
+                "-filter_complex_script", _overlay_filter_script(w["overlays"], size, position),
+                "-map", "[vout]",
+                *video_codec,
+                *_matching_x264_args(source_info),
+                "-pix_fmt", "yuv420p",
+                str(encoded)
+            ]
+            if _run_ffmpeg(cmd)[0] != 0 or _h264_stream_info(encoded) != source_info:
+                return False
+            names.append(encoded.name)
+        
+        list_file = tmp_dir / "parts.txt"
+        list_file.write_text("".join(f"file '{name}'\n" for name in names))
+        
+        cmd = [
+            ffmpeg, "-y",
+            "-f", "concat", "-safe", "0", "-i", str(list_file),
+            "-i", str(video_path),
+            "-map", "0:v", *_audio_args(audio_codec, 1),
+            "-c:v", "copy",
+            "-movflags", movflags,
+            str(output_path)
+        ]
+        return _run_ffmpeg(cmd)[0] == 0
+
+
+def _get_video_resolution(video_path: str) -> tuple:
+    """Get video resolution (width, height) via PyAV/ffprobe (ffmpeg stderr as fallback)."""
+    video_size = get_video_size(video_path)
+    if video_size:
+        return video_size
+    
+    ffmpeg = get_ffmpeg()
+    result = subprocess.run(
+        [ffmpeg, "-i", video_path],
+        capture_output=True, text=True
+    )
+    
+    # Look for video stream resolution - match "WIDTHxHEIGHT" after "Video:" line
+    # Handles common resolutions: 640x480, 1280x720, 1920x1080, 3840x2160, etc.
+    video_match = re.search(r'Video:.*?(\d{3,5})x(\d{3,5})', result.stderr)
+    if video_match:
+        return int(video_match.group(1)), int(video_match.group(2))
+    
+    # Warn and fall back to default
+    print(f"   ⚠️  Could not detect resolution for {Path(video_path).name}, using default {DEFAULT_RESOLUTION[0]}x{DEFAULT_RESOLUTION[1]}")
+    return DEFAULT_RESOLUTION
 
 
 def cmd_segment(args) -> dict:
@@ -594,8 +1089,6 @@ def cmd_segment(args) -> dict:
     Returns:
         {"video": "intro.mp4", "audio": "intro.mp3", "duration_s": 3.2, "resolution": "1280x720"}
     """
-    from vg_tts import tts_with_json_output
-    
     # Validate environment (need ElevenLabs + FAL)
     env_check = validate_env_for_command("talking-head.segment")
     if not env_check["success"]:
@@ -633,15 +1126,14 @@ def cmd_segment(args) -> dict:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Step 1: Generate TTS
+        # Step 1: Generate TTS (and, concurrently, the character for step 2)
         text_preview = args.text[:50] + "..." if len(args.text) > 50 else args.text
         print(f"🎤 Generating TTS: \"{text_preview}\"")
+        if not args.character:
+            print("   🎭 Auto-generating YouTuber studio character...")
         
-        tts_result = tts_with_json_output(
-            text=args.text,
-            output_path=str(audio_path),
-            voice_id=args.voice_id
-        )
+        # Studio style (YouTuber in studio) for fullscreen segments
+        tts_result, char_result = _tts_and_character(args, audio_path, "studio")
         
         if not tts_result.get("success"):
             return {
@@ -653,18 +1145,12 @@ def cmd_segment(args) -> dict:
         duration_s = tts_result.get("duration_s") or tts_result.get("duration") or 0
         print(f"   ✅ Audio: {audio_path.name} ({duration_s:.1f}s)")
         
-        # Step 2: Generate character if not provided
+        # Step 2: Character (generated alongside TTS) if not provided
         # For fullscreen segments (intro/outro/segment), use studio style (YouTuber in studio)
         character = args.character
         if not character:
-            print("   🎭 Auto-generating YouTuber studio character...")
-            char_result = generate_character(style="studio")  # Studio style for fullscreen segments
             if not char_result.get("success"):
-                return {
-                    "success": False,
-                    "error": f"Character generation failed: {char_result.get('error')}",
-                    "code": char_result.get("code", "CHARACTER_ERROR")
-                }
+                return char_result
             character = char_result.get("image")
             print(f"   ✅ Using studio character: {character}")
         
@@ -672,15 +1158,14 @@ def cmd_segment(args) -> dict:
         # With studio image (16:9), output will be fullscreen, not square
         print(f"🎬 Generating fullscreen talking head with {args.model}...")
         
-        # Use temp file for intermediate TH if scaling needed
-        th_raw_path = None
+        # OmniHuman renders to a sibling temp name that only replaces the output once
+        # it fits the target, so a failed scale never leaves an unscaled segment behind.
+        # It is only re-encoded when its size differs, and then in a single scale+pad pass
+        raw_path = output_path.with_name(f"{output_path.stem}.raw{output_path.suffix}")
         try:
-            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp:
-                th_raw_path = tmp.name
-            
             th_result = generate_talking_head(
                 audio_path=str(audio_path),
-                output_path=th_raw_path,
+                output_path=str(raw_path),
                 character_image=character,
                 model=args.model
             )
@@ -694,51 +1179,75 @@ def cmd_segment(args) -> dict:
             
             print(f"   ✅ Fullscreen TH generated")
             
-            # Step 4: Scale to exact target resolution (OmniHuman output may be slightly different)
-            print(f"🖼️  Scaling to target resolution ({target_w}x{target_h})...")
-            
+            # Step 4: Scale to exact target resolution (OmniHuman output may be slightly different).
+            # An H.264/yuv420p file already at that size is only remuxed (stream copy) so it still
+            # gets the requested movflags; --quality/--threads apply when it is re-encoded
+            info = _h264_stream_info(raw_path)
             ffmpeg = get_ffmpeg()
-            scale_cmd = [
-                ffmpeg, "-y",
-                "-i", th_raw_path,
-                "-vf", f"scale={target_w}:{target_h}:force_original_aspect_ratio=decrease,pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2",
-                "-c:v", "libx264", "-preset", "fast", "-crf", "20",
-                "-c:a", "aac", "-b:a", "192k",
-                "-pix_fmt", "yuv420p",
-                "-movflags", "+faststart",
-                str(output_path)
-            ]
+            scaled_path = output_path.with_name(f"{output_path.stem}.scaling{output_path.suffix}")
+            if (info and info.get("codec_name") == "h264" and info.get("pix_fmt") == "yuv420p"
+                    and (info.get("width"), info.get("height")) == (target_w, target_h)):
+                print(f"🖼️  Already at target resolution ({target_w}x{target_h}), remuxing without re-encode")
+                scale_cmd = [
+                    ffmpeg, "-y",
+                    "-i", str(raw_path),
+                    "-c", "copy",
+                    "-movflags", _movflags(args),
+                    str(scaled_path)
+                ]
+            else:
+                print(f"🖼️  Scaling to target resolution ({target_w}x{target_h})...")
+                
+                # OmniHuman output normally carries AAC already: pass it through rather than re-encode
+                if get_audio_codec(raw_path) == "aac":
+                    audio_args = ["-c:a", "copy"]
+                else:
+                    audio_args = ["-c:a", "aac", "-b:a", "192k"]
+                threads = str(args.threads or _available_cpus())
+                scale_cmd = [
+                    ffmpeg, "-y",
+                    "-i", str(raw_path),
+                    "-filter_threads", threads, "-threads", threads,
+                    "-vf", (
+                        f"scale={target_w}:{target_h}:force_original_aspect_ratio=decrease,"
+                        f"pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2,format=yuv420p"
+                    ),
+                    *quality_encoder_args(ffmpeg, args.quality),
+                    *audio_args,
+                    "-movflags", _movflags(args),
+                    str(scaled_path)
+                ]
             
             result = subprocess.run(scale_cmd, capture_output=True, text=True, timeout=300)
             
             if result.returncode != 0:
+                scaled_path.unlink(missing_ok=True)
                 return {
                     "success": False,
                     "error": f"Scaling failed: {result.stderr}",
                     "code": "SCALING_ERROR"
                 }
-            
-            # Get final duration
-            final_duration = get_duration(Path(output_path))
-            
-            print(f"   ✅ Video: {output_path.name}")
-            print(f"✅ Fullscreen TH segment complete!")
-            
-            return {
-                "success": True,
-                "video": str(output_path),
-                "audio": str(audio_path),
-                "duration_s": final_duration,
-                "resolution": f"{target_w}x{target_h}",
-                "model": args.model,
-                "type": "segment",  # Fullscreen segment (not overlay)
-                "style": "studio",  # YouTuber studio style
-                "cached": th_result.get("cached", False)
-            }
+            os.replace(scaled_path, output_path)
         finally:
-            # Always clean up temp file
-            if th_raw_path:
-                Path(th_raw_path).unlink(missing_ok=True)
+            raw_path.unlink(missing_ok=True)
+        
+        # Get final duration
+        final_duration = get_duration(Path(output_path))
+        
+        print(f"   ✅ Video: {output_path.name}")
+        print(f"✅ Fullscreen TH segment complete!")
+        
+        return {
+            "success": True,
+            "video": str(output_path),
+            "audio": str(audio_path),
+            "duration_s": final_duration,
+            "resolution": f"{target_w}x{target_h}",
+            "model": args.model,
+            "type": "segment",  # Fullscreen segment (not overlay)
+            "style": "studio",  # YouTuber studio style
+            "cached": th_result.get("cached", False)
+        }
     
     except Exception as e:
         return {
@@ -748,6 +1257,128 @@ def cmd_segment(args) -> dict:
         }
 
 
+# Option defaults for batch jobs: the create/segment flags with underscores
+# ("fragmented": true maps to faststart=False like the --fragmented flag;
+# threads defaults to an even share of the CPUs per worker)
+_BATCH_JOB_DEFAULTS = {
+    "character": None,
+    "model": "omnihuman",
+    "voice_id": DEFAULT_VOICE_ID,
+    "resolution": None,
+    "match_video": None,
+    "background": "gradient",
+    "quality": DEFAULT_QUALITY,
+    "faststart": True,
+    "threads": 0,
+}
+
+# Every key a batch job may set; anything else is rejected rather than ignored
+_BATCH_JOB_KEYS = {"type", "text", "output", "fragmented", *_BATCH_JOB_DEFAULTS}
+
+
+def cmd_batch(args) -> dict:
+    """
+    Run several create/segment jobs concurrently.
+    
+    TTS and OmniHuman generation are remote calls that mostly wait, so running the
+    jobs side by side overlaps their queue and inference time. The auto character
+    is resolved once per style before the jobs start, so they share one image
+    instead of racing to generate it.
+    
+    Usage:
+        vg talking-head batch --jobs jobs.json
+    
+    Jobs file:
+        [{"type": "segment", "text": "Welcome!", "output": "intro.mp4", "match_video": "main.mp4"},
+         {"type": "create", "text": "Here's the dashboard.", "output": "th1.mp4"}]
+    
+    Returns:
+        {"jobs": [<create/segment result>, ...], "successful_jobs": 2}
+    """
+    try:
+        jobs = json.loads(Path(args.jobs).read_text(encoding="utf-8"))
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to load jobs file: {e}",
+            "code": "VALIDATION_ERROR"
+        }
+    
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        return {
+            "success": False,
+            "error": "Jobs file must contain a JSON array of job objects",
+            "code": "VALIDATION_ERROR"
+        }
+    
+    commands = {"create": (cmd_create, "portrait"), "segment": (cmd_segment, "studio")}
+    # Jobs share the machine: split the CPUs between concurrent ffmpeg runs
+    workers = max(1, args.workers)
+    job_defaults = {**_BATCH_JOB_DEFAULTS, "threads": max(1, _available_cpus() // workers)}
+    results = [None] * len(jobs)
+    job_args = []
+    for i, job in enumerate(jobs):
+        job_type = job.get("type", "segment")
+        if job_type not in commands or not job.get("text") or not job.get("output"):
+            return {
+                "success": False,
+                "error": f"Invalid job {i}: needs type create/segment, text and output",
+                "code": "VALIDATION_ERROR"
+            }
+        unknown = sorted(set(job) - _BATCH_JOB_KEYS)
+        if unknown:
+            # A misspelled option would otherwise run the job with defaults
+            results[i] = {
+                "success": False,
+                "error": f"Invalid job {i}: unknown option(s) {', '.join(unknown)}",
+                "code": "VALIDATION_ERROR",
+                "output": job["output"]
+            }
+            continue
+        options = {**job_defaults, **job}
+        options.pop("type", None)
+        if "fragmented" in options:
+            options["faststart"] = not options.pop("fragmented")
+        job_args.append((i, job_type, argparse.Namespace(**options)))
+    
+    # One auto character per style, shared by every job without --character
+    characters = {}
+    for _, job_type, ns in job_args:
+        style = commands[job_type][1]
+        if not ns.character and style not in characters:
+            char_result = _auto_character(style)
+            if not char_result.get("success"):
+                return char_result
+            characters[style] = char_result.get("image")
+        if not ns.character:
+            ns.character = characters[style]
+    
+    def run_job(job) -> dict:
+        # One failing job must not take the others' results down with it
+        _, job_type, ns = job
+        try:
+            return commands[job_type][0](ns)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "code": "UNEXPECTED_ERROR",
+                "output": ns.output
+            }
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (i, _, _), result in zip(job_args, pool.map(run_job, job_args)):
+            results[i] = result
+    
+    successful = sum(1 for r in results if r.get("success"))
+    return {
+        "success": successful == len(results),
+        "jobs": results,
+        "total_jobs": len(results),
+        "successful_jobs": successful
+    }
+
+
 def cmd_title(args) -> dict:
     """
     Generate AI title card video for transitions using xAI Grok Imagine Video.
@@ -763,8 +1394,6 @@ def cmd_title(args) -> dict:
     Returns:
         {"video": "title.mp4", "duration_s": 3.0, "resolution": "1280x720", "style": "cinematic"}
     """
-    import os
-    
     # Validate environment
     env_check = validate_env_for_command("talking-head.title")
     if not env_check["success"]:
@@ -845,7 +1474,6 @@ def cmd_title(args) -> dict:
             print(f"   ✅ Grok generated {generated_duration:.1f}s video")
             
             # Download video
-            import urllib.request
             temp_video = output_path.with_suffix('.temp.mp4')
             urllib.request.urlretrieve(video_url, str(temp_video))
             
@@ -4,12 +4,21 @@ Shared utilities for vg CLI.
 Error classification, path handling, caching, and media utilities.
 """
 
+import functools
 import hashlib
 from pathlib import Path
 from typing import Any, Optional, Union
 import subprocess
 import json
 import os
+import threading
+
+# Try to import PyAV - optional, probes media in-process instead of spawning ffmpeg/ffprobe
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
 
 # Error classification
 class VGError(Exception):
@@ -100,6 +109,9 @@ def success_response(**kwargs) -> dict:
 CACHE_DIR = Path.home() / ".cache" / "vg"
 CACHE_METADATA_FILE = CACHE_DIR / "cache_metadata.json"
 
+# Serializes cache_metadata.json read-modify-write cycles (talking-head batch runs jobs on threads)
+_CACHE_METADATA_LOCK = threading.Lock()
+
 def ensure_cache_dir():
     """Ensure cache directory exists."""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -120,9 +132,11 @@ def load_cache_metadata() -> dict:
         return {}
 
 def save_cache_metadata(metadata: dict):
-    """Save cache metadata."""
+    """Save cache metadata (atomically, so readers never see a half-written file)."""
     ensure_cache_dir()
-    CACHE_METADATA_FILE.write_text(json.dumps(metadata, indent=2, default=str))
+    tmp = CACHE_METADATA_FILE.with_name(f"{CACHE_METADATA_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(metadata, indent=2, default=str))
+    os.replace(tmp, CACHE_METADATA_FILE)
 
 def get_cached(cache_type: str, key: str) -> Optional[Path]:
     """Get cached file if exists and not expired."""
@@ -131,19 +145,20 @@ def get_cached(cache_type: str, key: str) -> Optional[Path]:
         return None
 
     # Check metadata for expiration (24 hours default)
-    metadata = load_cache_metadata()
-    cache_entry = metadata.get(f"{cache_type}/{key}", {})
-    created = cache_entry.get("created")
-
-    if created:
-        import time
-        age_hours = (time.time() - created) / 3600
-        if age_hours > 24:  # Expire after 24 hours
-            # Remove expired cache
-            cache_path.unlink(missing_ok=True)
-            metadata.pop(f"{cache_type}/{key}", None)
-            save_cache_metadata(metadata)
-            return None
+    with _CACHE_METADATA_LOCK:
+        metadata = load_cache_metadata()
+        cache_entry = metadata.get(f"{cache_type}/{key}", {})
+        created = cache_entry.get("created")
+
+        if created:
+            import time
+            age_hours = (time.time() - created) / 3600
+            if age_hours > 24:  # Expire after 24 hours
+                # Remove expired cache
+                cache_path.unlink(missing_ok=True)
+                metadata.pop(f"{cache_type}/{key}", None)
+                save_cache_metadata(metadata)
+                return None
 
     return cache_path
 
@@ -153,19 +168,23 @@ def save_to_cache(cache_type: str, key: str, source: Path, metadata: dict = None
     cache_dir.mkdir(parents=True, exist_ok=True)
     cache_path = cache_dir / f"{key}.cache"
 
+    # Copy under a temp name so a concurrent get_cached never returns a partial file
     import shutil
-    shutil.copy(source, cache_path)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    shutil.copy(source, tmp)
+    os.replace(tmp, cache_path)
 
     # Update metadata
-    cache_metadata = load_cache_metadata()
-    cache_key_full = f"{cache_type}/{key}"
-    cache_metadata[cache_key_full] = {
-        "created": source.stat().st_ctime,
-        "size": source.stat().st_size,
-        "source_path": str(source),
-        **(metadata or {})
-    }
-    save_cache_metadata(cache_metadata)
+    with _CACHE_METADATA_LOCK:
+        cache_metadata = load_cache_metadata()
+        cache_key_full = f"{cache_type}/{key}"
+        cache_metadata[cache_key_full] = {
+            "created": source.stat().st_ctime,
+            "size": source.stat().st_size,
+            "source_path": str(source),
+            **(metadata or {})
+        }
+        save_cache_metadata(cache_metadata)
 
     return cache_path
 
@@ -173,29 +192,30 @@ def clear_cache(cache_type: Optional[str] = None, older_than_hours: Optional[int
     """Clear cache files."""
     import time
 
-    metadata = load_cache_metadata()
-    to_remove = []
+    with _CACHE_METADATA_LOCK:
+        metadata = load_cache_metadata()
+        to_remove = []
 
-    for cache_key_full, cache_info in metadata.items():
-        if cache_type and not cache_key_full.startswith(f"{cache_type}/"):
-            continue
+        for cache_key_full, cache_info in metadata.items():
+            if cache_type and not cache_key_full.startswith(f"{cache_type}/"):
+                continue
 
-        cache_path = CACHE_DIR / cache_key_full.replace("/", "/") / f"{cache_key_full.split('/')[-1]}.cache"
+            cache_path = CACHE_DIR / cache_key_full.replace("/", "/") / f"{cache_key_full.split('/')[-1]}.cache"
 
-        # Check age
-        if older_than_hours:
-            age_hours = (time.time() - cache_info.get("created", 0)) / 3600
-            if age_hours < older_than_hours:
-                continue
+            # Check age
+            if older_than_hours:
+                age_hours = (time.time() - cache_info.get("created", 0)) / 3600
+                if age_hours < older_than_hours:
+                    continue
 
-        # Remove file and metadata
-        cache_path.unlink(missing_ok=True)
-        to_remove.append(cache_key_full)
+            # Remove file and metadata
+            cache_path.unlink(missing_ok=True)
+            to_remove.append(cache_key_full)
 
-    # Update metadata
-    for key in to_remove:
-        metadata.pop(key, None)
-    save_cache_metadata(metadata)
+        # Update metadata
+        for key in to_remove:
+            metadata.pop(key, None)
+        save_cache_metadata(metadata)
 
     return len(to_remove)
 
@@ -230,11 +250,19 @@ def get_cache_stats() -> dict:
 def get_duration(file_path: Path) -> float:
     """Get duration of audio/video file.
     
-    Uses ffmpeg stderr parsing (works without ffprobe).
-    Falls back to ffprobe if available.
+    Uses PyAV in-process when installed, then ffmpeg stderr parsing
+    (works without ffprobe), then ffprobe if available.
     """
     import re
     
+    if AV_AVAILABLE:
+        try:
+            with av.open(str(file_path)) as container:
+                if container.duration:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+    
     # Try ffmpeg first (more reliable - uses get_ffmpeg() resolution)
     ffmpeg = get_ffmpeg()
     if ffmpeg:
@@ -265,6 +293,71 @@ def get_duration(file_path: Path) -> float:
     except Exception:
         return 0.0
 
+@functools.lru_cache(maxsize=256)
+def _duration_cached(path_str: str, mtime_ns: int, size: int) -> float:
+    return get_duration(Path(path_str))
+
+def cached_duration(file_path: Path, stat_result: Optional[os.stat_result] = None) -> float:
+    """get_duration memoized per (path, mtime, size), so repeated files are probed once.
+    
+    Pass stat_result when the caller already has it to skip the extra stat.
+    """
+    st = stat_result or os.stat(file_path)
+    return _duration_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+def get_video_size(file_path: Union[str, Path]) -> Optional[tuple]:
+    """Get (width, height) of the first video stream via PyAV or ffprobe; None if unknown."""
+    if AV_AVAILABLE:
+        try:
+            with av.open(str(file_path)) as container:
+                stream = container.streams.video[0]
+                if stream.width and stream.height:
+                    return stream.width, stream.height
+        except Exception:
+            pass
+    
+    ffprobe = get_ffprobe()
+    if ffprobe:
+        try:
+            result = subprocess.run(
+                [ffprobe, "-v", "error", "-select_streams", "v:0",
+                 "-show_entries", "stream=width,height", "-of", "json", str(file_path)],
+                capture_output=True, text=True, timeout=10
+            )
+            stream = json.loads(result.stdout)["streams"][0]
+            return int(stream["width"]), int(stream["height"])
+        except Exception:
+            pass
+    
+    return None
+
+
+def get_audio_codec(file_path: Union[str, Path]) -> Optional[str]:
+    """Codec name of the first audio stream via PyAV or ffprobe; "" if there is none, None if unknown."""
+    if AV_AVAILABLE:
+        try:
+            with av.open(str(file_path)) as container:
+                streams = container.streams.audio
+                return streams[0].codec_context.name if streams else ""
+        except Exception:
+            pass
+    
+    ffprobe = get_ffprobe()
+    if ffprobe:
+        try:
+            result = subprocess.run(
+                [ffprobe, "-v", "error", "-select_streams", "a:0",
+                 "-show_entries", "stream=codec_name", "-of", "json", str(file_path)],
+                capture_output=True, text=True, timeout=10
+            )
+            if result.returncode == 0:
+                streams = json.loads(result.stdout).get("streams") or []
+                return streams[0]["codec_name"] if streams else ""
+        except Exception:
+            pass
+    
+    return None
+
 def get_file_info(file_path: Path) -> dict:
     """Get comprehensive file info."""
     if not file_path.exists():
@@ -323,9 +416,10 @@ def get_file_info(file_path: Path) -> dict:
     return info
 
 # FFmpeg resolution - consolidated from multiple implementations
+@functools.lru_cache(maxsize=None)
 def get_ffmpeg() -> Optional[str]:
     """
-    Get path to ffmpeg binary with comprehensive fallback strategy.
+    Get path to ffmpeg binary with comprehensive fallback strategy (resolved once per process).
     
     Tries in order:
     1. System ffmpeg (via PATH)
@@ -399,6 +493,29 @@ def get_ffmpeg() -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def get_ffprobe() -> Optional[str]:
+    """
+    Get path to ffprobe binary (resolved once per process).
+    
+    Tries PATH first, then an ffprobe next to the resolved ffmpeg binary.
+    
+    Returns:
+        Path to ffprobe binary or None if not found (callers fall back to ffmpeg parsing)
+    """
+    import shutil
+    system_ffprobe = shutil.which("ffprobe")
+    if system_ffprobe:
+        return system_ffprobe
+    
+    ffmpeg = get_ffmpeg()
+    if ffmpeg and os.sep in ffmpeg:
+        sibling = Path(ffmpeg).with_name(Path(ffmpeg).name.replace("ffmpeg", "ffprobe"))
+        if sibling.exists():
+            return str(sibling)
+    
+    return None
+
 def require_ffmpeg() -> str:
     """
     Get ffmpeg path or raise error if not found.
@@ -417,6 +534,110 @@ def require_ffmpeg() -> str:
     return ffmpeg
 
 
+# Hardware H.264 encoders, in order of preference
+_HW_H264_ENCODERS = ("h264_nvenc", "h264_qsv")
+
+@functools.lru_cache(maxsize=None)
+def detect_hw_h264_encoder(ffmpeg: str) -> Optional[str]:
+    """
+    Find a usable hardware H.264 encoder for this ffmpeg binary (cached per process).
+    
+    An encoder listed by `ffmpeg -encoders` may still lack a device or driver, so
+    each candidate is confirmed with a one-frame test encode.
+    
+    Returns:
+        Encoder name (e.g. "h264_nvenc") or None to use libx264
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        )
+    except Exception:
+        return None
+    
+    for encoder in _HW_H264_ENCODERS:
+        if encoder not in result.stdout:
+            continue
+        try:
+            probe = subprocess.run(
+                [ffmpeg, "-hide_banner", "-v", "error",
+                 "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                 "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+                capture_output=True, text=True, timeout=10
+            )
+        except Exception:
+            continue
+        if probe.returncode == 0:
+            return encoder
+    return None
+
+def h264_encoder_args(
+    ffmpeg: str,
+    crf: int = 20,
+    preset: str = "medium",
+    hw_preset: str = "p4",
+    tune: Optional[str] = None
+) -> list:
+    """
+    FFmpeg video codec args for H.264 output, using a hardware encoder when available.
+    
+    Args:
+        ffmpeg: ffmpeg binary the args will be passed to
+        crf: libx264 CRF (mapped to the equivalent constant-quality setting on hardware)
+        preset: libx264 preset (used only for the libx264 fallback)
+        hw_preset: NVENC preset, p1 (fastest) to p7 (best)
+        tune: libx264 tune (e.g. "film"); ignored on hardware
+    """
+    encoder = detect_hw_h264_encoder(ffmpeg)
+    if encoder == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", hw_preset, "-tune", "hq", "-rc", "vbr", "-cq", str(crf), "-b:v", "0"]
+    if encoder == "h264_qsv":
+        return ["-c:v", "h264_qsv", "-preset", "medium", "-global_quality", str(crf)]
+    args = ["-c:v", "libx264", "-preset", preset, "-crf", str(crf)]
+    if tune:
+        args += ["-tune", tune]
+    return args
+
+# Encode quality presets: libx264 preset, CRF, NVENC preset, libx264 tune
+QUALITY_PRESETS = {
+    "draft": ("veryfast", 23, "p1", None),
+    "balanced": ("fast", 21, "p4", None),
+    "final": ("medium", 20, "p7", "film"),
+}
+DEFAULT_QUALITY = "balanced"
+
+def quality_encoder_args(ffmpeg: str, quality: str = DEFAULT_QUALITY) -> list:
+    """H.264 codec args for a named quality preset (draft, balanced, final)."""
+    preset, crf, hw_preset, tune = QUALITY_PRESETS[quality]
+    return h264_encoder_args(ffmpeg, crf=crf, preset=preset, hw_preset=hw_preset, tune=tune)
+
+@functools.lru_cache(maxsize=None)
+def get_ffmpeg_hwaccels(ffmpeg: str) -> frozenset:
+    """Hardware decode methods this ffmpeg build lists (cached per process; empty if unknown)."""
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-hwaccels"],
+            capture_output=True, text=True, timeout=10
+        )
+    except Exception:
+        return frozenset()
+    
+    # First line is the "Hardware acceleration methods:" header
+    return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+
+def hw_decode_args(ffmpeg: str) -> list:
+    """
+    FFmpeg input args to decode on the GPU that the hardware encoder runs on.
+    
+    Frames are downloaded to system memory (no -hwaccel_output_format), so CPU
+    filters such as overlay still apply; place these before the input's -i.
+    """
+    if detect_hw_h264_encoder(ffmpeg) == "h264_nvenc" and "cuda" in get_ffmpeg_hwaccels(ffmpeg):
+        return ["-hwaccel", "cuda"]
+    return []
+
+
 # Path normalization
 def normalize_path(path: Union[str, Path], must_exist: bool = False) -> Path:
     """Normalize path to absolute Path object."""
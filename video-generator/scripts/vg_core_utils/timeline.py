@@ -49,11 +49,15 @@ def _parse_timeline_markers_from_md(md_content: str) -> Dict[str, float]:
             continue
         if '|' not in line:
             continue
-        parts = [p.strip() for p in line.split('|')]
-        parts = [p for p in parts if p]
+        # Only the first two cells are needed; bounded split skips the rest of the row
+        if line.startswith('|'):
+            line = line[1:]
+        parts = line.split('|', 2)
         if len(parts) >= 2:
-            marker = parts[0]
-            time_str = parts[1]
+            marker = parts[0].strip()
+            time_str = parts[1].strip()
+            if not marker or not time_str:
+                continue
             try:
                 value = float(re.sub(r'[^0-9.\-]+', '', time_str))
                 markers[marker] = value
@@ -16,7 +16,7 @@ from generate_talking_head import (
     integrate_talking_head_into_video,
     get_ffmpeg_path
 )
-from vg_common import VGError, classify_error, get_suggestion, get_duration, cache_key, get_cached, save_to_cache
+from vg_common import VGError, classify_error, get_suggestion, get_duration, cache_key, get_cached, save_to_cache, quality_encoder_args, DEFAULT_QUALITY
 
 
 @dataclass
@@ -143,7 +143,8 @@ def composite_talking_head(
     output_path: str,
     position: str = "bottom-right",
     size: int = 280,
-    start_time: float = 0
+    start_time: float = 0,
+    quality: str = DEFAULT_QUALITY
 ) -> dict:
     """
     Composite talking head onto main video.
@@ -169,7 +170,8 @@ def composite_talking_head(
             output_video=output_path,
             start_time=start_time,
             position=position,
-            size_px=size
+            size_px=size,
+            video_codec_args=quality_encoder_args(get_ffmpeg_path(), quality)
         )
 
         # Get duration